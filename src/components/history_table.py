@@ -2,10 +2,18 @@ from __future__ import annotations
 
 import asyncio
 import csv
+import io
 import re
-from collections import deque
+import threading
+from bisect import bisect_right
+from collections.abc import Callable, Iterable
+from concurrent.futures import ThreadPoolExecutor
 from datetime import date as _date
+from functools import partial
+from itertools import accumulate
+from operator import add, is_, itemgetter
 from pathlib import Path
+from sys import intern
 
 import flet as ft
 
@@ -13,17 +21,116 @@ from src.services.config_service import get_history_sync_config, get_ui_config
 from src.services.history_db_adapter import (
     cleanup_sync_files,
     export_history_db_to_csv,
+    history_search_is_literal,
     manual_sync,
     publish_all_history_to_sync,
     read_history_filtered_tail,
     read_history_filtered_tail_no_count,
+    read_history_max_row_id,
+    read_history_since,
     read_history_tail,
 )
 from src.utils.theme import DANGER, ON_COLOR, PRIMARY
 from src.utils.ui_helpers import open_dialog, snack
 
+# First standalone number in a shift label ("Shift 3", "shift-2", "3").
+_SHIFT_NUMBER_RE = re.compile(r"(?<![^\s-])\+?(\d+)(?![^\s-])")
+
+
+# Any digit run in a shift label picks the row colour ("Shift 02" -> 2).
+_SHIFT_DIGITS_RE = re.compile(r"\d+")
+
+# Row background per shift number; other labels get BLUE_GREY_50.
+_SHIFT_ROW_COLORS = {
+    1: ft.Colors.RED_50,
+    2: ft.Colors.GREEN_50,
+    3: ft.Colors.YELLOW_50,
+}
+
+
+# Joins per-row search blobs into one scannable string (never in a query).
+_CORPUS_SEP = "\x1e"
+
+# CSV columns with few distinct values, interned while parsing.
+_INTERN_COLUMNS = frozenset({"shift", "user", "date_field", "func_location", "link_up"})
+
+
+def _to_str(v) -> str:
+    """Same as str(v or ""), but returns str values as-is (no new object)."""
+    if type(v) is str:
+        return v
+    return str(v) if v else ""
+
+
+def _build_corpus(blobs: list[str]) -> tuple[str, list[int]]:
+    """Join search blobs into one string; return it with each blob's start."""
+    # Row i starts after every earlier blob plus its separator; the running
+    # sum is built by C iterators, not a per-row Python loop.
+    starts = list(accumulate(map(partial(add, 1), map(len, blobs)), initial=0))
+    starts.pop()
+    return _CORPUS_SEP.join(blobs), starts
+
+
+def _find_in_corpus(text: str, starts: list[int], q_l: str) -> list[int]:
+    """Return indices of the rows whose slice of `text` contains `q_l`.
+
+    Rows are joined with a record separator the query cannot contain, so a
+    hit never spans two rows; after a hit the scan resumes at the next row's
+    start so each row is reported once.
+    """
+    idx: list[int] = []
+    n = len(starts)
+    find = text.find
+    hit = find(q_l)
+    while hit != -1:
+        i = bisect_right(starts, hit) - 1
+        idx.append(i)
+        if i + 1 >= n:
+            break
+        hit = find(q_l, starts[i + 1])
+    return idx
+
+
+def _find_in_corpus_rows(
+    text: str, starts: list[int], q_l: str, rows: Iterable[int]
+) -> list[int]:
+    """Return the indices in `rows` whose own slice of `text` contains `q_l`.
+
+    Each row is searched within its bounds, so a query containing the
+    separator cannot match across rows either.
+    """
+    n = len(starts)
+    end_of_text = len(text)
+    find = text.find
+    return [
+        i
+        for i in rows
+        if find(q_l, starts[i], starts[i + 1] - 1 if i + 1 < n else end_of_text)
+        != -1
+    ]
+
+
+def _shift_row_color(shift_l: str) -> str | None:
+    """Return the row colour for a stripped, lower-cased shift label."""
+    if not shift_l:
+        return None
+    if "all" in shift_l and "shift" in shift_l:
+        return ft.Colors.INDIGO_50
+    m = _SHIFT_DIGITS_RE.search(shift_l)
+    if m is None:
+        return ft.Colors.BLUE_GREY_50
+    return _SHIFT_ROW_COLORS.get(int(m.group(0)), ft.Colors.BLUE_GREY_50)
+
 
 class HistoryTableDialog:
+    # Short header labels for narrow columns; other headers are upper-cased.
+    _HEADER_LABELS: dict[str, str] = {
+        "link_up": "LU",
+        "func_location": "FL",
+        "date_field": "DATE",
+        "shift": "SHIFT",
+    }
+
     def __init__(
         self,
         *,
@@ -46,18 +153,12 @@ class HistoryTableDialog:
         # Prefer SQLite when available.
         self._use_sqlite: bool = bool(self.db_path is not None)
 
-        ui_cfg, _err = get_ui_config()
-        if max_rows is None:
-            max_rows = getattr(ui_cfg, "history_max_rows", 500)
-
-        if filter_no_count is None:
-            filter_no_count = getattr(ui_cfg, "history_filter_no_count", None)
-        if filter_no_count is None:
-            filter_no_count = self._use_sqlite
-
-        self._filter_no_count: bool = bool(filter_no_count)
-
-        self.max_rows = int(max_rows or 0) if max_rows is not None else 500
+        # Explicit arguments win over config.toml; None means "from [UI]",
+        # re-read on every show() (see _apply_ui_config).
+        self._max_rows_arg = max_rows
+        self._filter_no_count_arg = filter_no_count
+        self.max_rows: int = 500
+        self._filter_no_count: bool = self._use_sqlite
 
         self._dlg: ft.AlertDialog | None = None
         self._prev_on_resize = None
@@ -69,15 +170,61 @@ class HistoryTableDialog:
         self._dt: ft.DataTable | None = None
         self._content_container: ft.Container | None = None
         self._filter_tf: ft.TextField | None = None
+        # Set once the table tree exists; reopening the dialog then only
+        # replaces rows (and columns when _dt_fieldnames differs).
+        self._tree_built: bool = False
+        self._dt_fieldnames: tuple[str, ...] = ()
+        # Header label boxes of the current columns, in column order; a
+        # width change only mutates these (columns are rebuilt only when the
+        # column set changes).
+        self._header_containers: list[ft.Container] = []
+
+        # One style for every data cell, set on the DataTable (which applies
+        # it to its cells) instead of a size on each cell's Text.
+        self._cell_text_style = ft.TextStyle(size=11)
 
         self._file_picker = ft.FilePicker()
+        # Set once the picker is in page.overlay, so later export clicks skip
+        # the overlay membership scan and its page.update().
+        self._picker_attached: bool = False
 
         self._total_rows: int = 0
         self._base_rows_data: list[dict] = []
+        # One lowercased search string per base row (see _build_search_blobs).
+        self._row_search_blobs: list[str] = []
+        # Local row_id high-water mark of the loaded rows; the post-sync
+        # refresh only fetches rows inserted after it.
+        self._last_max_row_id: int = 0
         self._title_text: ft.Text | None = None
 
         # Cache for computed column widths to avoid repeated per-cell work.
         self._last_column_widths: dict[str, int] | None = None
+        # Window size last fitted, with the container and table it was applied
+        # to; a resize event that repeats it (or a second layout pass with the
+        # same size) changes nothing and sends nothing.
+        self._last_responsive_size: tuple[int, int, object, object] | None = None
+        self._widths_snapshot_cache: (
+            tuple[tuple[int, tuple[str, ...]], dict[str, int]] | None
+        ) = None
+        # (fieldnames, stretch column count, sum of fixed widths).
+        self._column_split_cache: tuple[tuple[str, ...], int, int] | None = None
+        # Snapshot dict -> widths list aligned with _fieldnames.
+        self._widths_list_cache: tuple[dict[str, int], list[int]] | None = None
+
+        # Built DataRow per source row, reused when the same row is rendered
+        # again (clearing a filter, narrowing an in-memory filter). Flet
+        # controls can only have one parent, so whole rows are the unit of
+        # reuse rather than individual cells. Keyed by id(row) and holding the
+        # row itself so the id cannot be recycled while cached; the third
+        # item is the positional widths list the row's cells carry, so a row
+        # cached before a resize is brought up to date when it is reused.
+        self._row_control_cache: dict[int, tuple[dict, ft.DataRow, list[int]]] = {}
+        # Fieldnames the cached rows were built for.
+        self._row_control_cache_layout: tuple[str, ...] | None = None
+        self._row_control_cache_max: int = 20000
+        # Row value reader specialized for the current visible column set
+        # (see _get_row_reader), keyed by the fieldnames it was built for.
+        self._cells_builder: tuple[tuple[str, ...], Callable] | None = None
 
         # Column sizing rules:
         # - issue/detail/action: stretch equally to fill remaining width
@@ -100,8 +247,91 @@ class HistoryTableDialog:
         self._min_stretch_width_px = 200
         self._width_padding_px = 48
 
+        # Windowed rendering: only about two viewports of filtered rows are
+        # turned into controls (see _row_window_size); scrolling near the
+        # bottom appends the next window. The chunk size is the fallback
+        # while the dialog size is still unknown.
+        self._render_chunk_rows: int = 100
+        # Minimum time between scroll events from the client (ms).
+        self._scroll_event_interval_ms: int = 100
+        self._rendered_count: int = 0
+        self._row_min_height_px: int = 40
+        # While a large legacy CSV is parsed off-thread, the loading text is
+        # refreshed every this many rows.
+        self._csv_progress_rows: int = 5000
+        # From this size on, a cold load reads the CSV tail backwards from
+        # the end of the file instead of parsing the whole file first.
+        self._csv_tail_seek_min_bytes: int = 4 << 20
+        # Parsed legacy CSV for filtering: ((mtime_ns, size), header, rows).
+        self._csv_rows_cache: (
+            tuple[tuple[int, int], list[str], list[list[str]]] | None
+        ) = None
+        # Search index for those rows: (rows list, fieldnames, corpus text,
+        # row starts). Only the joined corpus is kept, not a per-row blob
+        # list next to it, so the lowercased text is held once.
+        self._csv_corpus_cache: (
+            tuple[list[list[str]], tuple[str, ...], str, list[int]] | None
+        ) = None
+        # Last full CSV scan: (corpus text, lowercased query, all matching row
+        # indices, uncapped), so a longer query rescans only those rows.
+        self._csv_last_scan: tuple[str, str, list[int]] | None = None
+
         # Used to ignore stale async filter results.
         self._filter_seq: int = 0
+        # Same for loads: bumped by show() and close(), so a load or sync
+        # refresh from an earlier open stops at its next resume point.
+        self._load_seq: int = 0
+        # Query whose result is shown or being computed ("" = unfiltered
+        # view); re-submitting it is a no-op. None forces the next submit.
+        self._applied_query: str | None = ""
+        # Pending/in-flight filter task (from page.run_task), cancelled when
+        # a newer submit supersedes it.
+        self._filter_task = None
+        # Submits arriving within this window collapse into one filter pass.
+        self._filter_debounce_s: float = 0.05
+        # Live search (on_change): keystrokes within this window coalesce, so
+        # typing a word runs one filter for the final text ([UI]
+        # history_search_debounce_ms).
+        self._filter_live_debounce_s: float = 0.15
+        # Whether the CSV/DB filter matches queries literally, as the refine
+        # step does (see _can_refine_query).
+        self._source_search_literal: bool = False
+        self._apply_ui_config()
+        # In-memory filters over more rows than this run on a worker thread.
+        self._filter_thread_min_rows: int = 5000
+        # Single worker for load/filter jobs (see _run_in_worker), created on
+        # first use and kept for the dialog's lifetime (close() only cancels
+        # queued jobs), plus the jobs not finished yet and the filter job
+        # currently queued or running on it.
+        self._executor: ThreadPoolExecutor | None = None
+        self._worker_futures: set[asyncio.Future] = set()
+        self._filter_future: asyncio.Future | None = None
+        # _load_seq the running worker job was submitted under (see
+        # _job_is_current).
+        self._worker_state = threading.local()
+        # Last in-memory filter: (blobs list it ran on, query, matching row
+        # indices). A query containing the previous one can only match a
+        # subset, so it rescans just those indices. Tied to the blobs list
+        # object, so reloading rows invalidates it implicitly.
+        self._last_filter_cache: tuple[list[str], str, list[int]] | None = None
+        # Last CSV/DB filter result that returned *every* match:
+        # (base rows it was computed against, query, fields, total, matches,
+        # search blobs of the matches or None until first needed).
+        # A query containing that one can be answered from those matches.
+        self._last_full_matches: (
+            tuple[
+                list[dict],
+                str,
+                tuple[str, ...],
+                int | None,
+                list[dict],
+                list[str] | None,
+            ]
+            | None
+        ) = None
+        # All blobs joined into one string plus each blob's start offset, so a
+        # full scan is a str.find() loop in C (see _find_in_corpus).
+        self._blob_corpus: tuple[list[str], str, list[int]] | None = None
 
         # Export behavior
         # - view: export only what's currently displayed (fast)
@@ -117,56 +347,79 @@ class HistoryTableDialog:
 
         def _parse_int(v) -> int:
             try:
-                s = str(v or "").strip()
+                s = _to_str(v).strip()
                 if not s:
                     return 0
                 return int(float(s))
             except Exception:
                 return 0
 
-        def _parse_date(v) -> _date:
+        def _date_ymd(v) -> int:
+            """Return the date as a YYYYMMDD int (0 when missing/invalid)."""
+            s = _to_str(v).strip()
+            if not s:
+                return 0
+            # Happy path for plain "YYYY-MM-DD": no date object, no exception.
+            # Days past 28 take the slow path so invalid dates stay invalid.
+            if (
+                len(s) == 10
+                and s[4] == "-"
+                and s[7] == "-"
+                and s.isascii()
+                and s[:4].isdigit()
+                and s[5:7].isdigit()
+                and s[8:].isdigit()
+            ):
+                y, m, d = int(s[:4]), int(s[5:7]), int(s[8:])
+                if y >= 1 and 1 <= m <= 12 and 1 <= d <= 28:
+                    return y * 10000 + m * 100 + d
             try:
-                s = str(v or "").strip()
-                if not s:
-                    return _date.min
-                return _date.fromisoformat(s)
+                dt = _date.fromisoformat(s)
             except Exception:
-                return _date.min
+                return 0
+            return dt.year * 10000 + dt.month * 100 + dt.day
 
         def _shift_key(v) -> tuple[int, str]:
-            s = str(v or "").strip()
-            s_l = s.lower()
+            s_l = _to_str(v).strip().lower()
             if not s_l:
                 # Empty shift goes last.
                 return (10000, "")
             if "all" in s_l and "shift" in s_l:
                 # Keep "All Shifts" after numbered shifts.
                 return (9999, s_l)
-            parts = [p for p in s_l.replace("-", " ").split() if p]
-            for p in parts:
-                try:
-                    # Descending shift number: Shift 3 before Shift 2 before Shift 1
-                    return (-int(p), s_l)
-                except Exception:
-                    continue
+            m = _SHIFT_NUMBER_RE.search(s_l)
+            if m:
+                # Descending shift number: Shift 3 before Shift 2 before Shift 1
+                return (-int(m.group(1)), s_l)
             # Non-numeric shift labels: place after numbered shifts.
             return (0, s_l)
 
-        def _key(row: dict) -> tuple:
-            r = row or {}
-            d = _parse_date(r.get("date_field", ""))
-            # Sort date descending (newest first). Missing/invalid dates go last.
-            date_key = -int(getattr(d, "toordinal", lambda: 0)() or 0)
-            sh = _shift_key(r.get("shift", ""))
-            saved_at = str(r.get("saved_at", "") or "")
-            save_id = str(r.get("save_id", "") or "")
-            card_i = _parse_int(r.get("card_index", ""))
-            detail_i = _parse_int(r.get("detail_index", ""))
-            action_i = _parse_int(r.get("action_index", ""))
-            return (date_key, sh, saved_at, save_id, card_i, detail_i, action_i)
-
         try:
-            return sorted(list(rows), key=_key)
+            # Build each sort-key column in one pass (SoA), then sort row
+            # indices by the zipped key tuples and gather the rows once.
+            rs = [r or {} for r in rows]
+            # Sort date descending (newest first). Missing/invalid dates go last.
+            date_keys = [-_date_ymd(r.get("date_field", "")) for r in rs]
+            shift_keys = [_shift_key(r.get("shift", "")) for r in rs]
+            saved_ats = [_to_str(r.get("saved_at", "")) for r in rs]
+            save_ids = [_to_str(r.get("save_id", "")) for r in rs]
+            card_is = [_parse_int(r.get("card_index", "")) for r in rs]
+            detail_is = [_parse_int(r.get("detail_index", "")) for r in rs]
+            action_is = [_parse_int(r.get("action_index", "")) for r in rs]
+
+            keys = list(
+                zip(
+                    date_keys,
+                    shift_keys,
+                    saved_ats,
+                    save_ids,
+                    card_is,
+                    detail_is,
+                    action_is,
+                )
+            )
+            order = sorted(range(len(rows)), key=keys.__getitem__)
+            return [rows[i] for i in order]
         except Exception:
             return list(rows)
 
@@ -316,6 +569,49 @@ class HistoryTableDialog:
 
         open_dialog(page, dlg)
 
+    def _apply_ui_config(self) -> None:
+        """(Re)read the history settings from config.toml.
+
+        Called on construction and on every show(), so edits to
+        history_max_rows, history_filter_no_count and
+        history_search_debounce_ms (and the history storage mode) apply to a
+        reused dialog at its next open.
+        """
+        ui_cfg, _err = get_ui_config()
+        max_rows = self._max_rows_arg
+        if max_rows is None:
+            max_rows = getattr(ui_cfg, "history_max_rows", 500)
+
+        filter_no_count = self._filter_no_count_arg
+        if filter_no_count is None:
+            filter_no_count = getattr(ui_cfg, "history_filter_no_count", None)
+        if filter_no_count is None:
+            filter_no_count = self._use_sqlite
+
+        self._filter_no_count = bool(filter_no_count)
+        self.max_rows = int(max_rows or 0) if max_rows is not None else 500
+        self._filter_live_debounce_s = (
+            int(getattr(ui_cfg, "history_search_debounce_ms", 150)) / 1000.0
+        )
+        try:
+            self._source_search_literal = bool(
+                not (self._use_sqlite and self.db_path is not None)
+                or history_search_is_literal()
+            )
+        except Exception:
+            self._source_search_literal = False
+
+    def _can_refine_query(self, q: str) -> bool:
+        """True when a Python substring re-test agrees with the source filter.
+
+        The CSV and Local+Sync filters match literally, like the refine step.
+        Shared SQLite's LIKE treats `_`/`%` as wildcards and folds only ASCII
+        case, so such queries are never remembered or refined there.
+        """
+        if self._source_search_literal:
+            return True
+        return q.isascii() and "_" not in q and "%" not in q
+
     def show(self):
         page = self.page
         if page is None:
@@ -335,79 +631,21 @@ class HistoryTableDialog:
                 snack(page, f"History not found: {self.csv_path}", kind="warning")
                 return
 
-        # Open a lightweight dialog immediately (prevents perceived "hang").
-        self._title_text = ft.Text(f"{self.title} (loading…)")
-        loading_ring = ft.ProgressRing()
-        loading_text = ft.Text("Loading history…", size=12)
-
-        loading_overlay = ft.Container(
-            content=ft.Column(
-                controls=[loading_ring, loading_text],
-                horizontal_alignment=ft.CrossAxisAlignment.CENTER,
-                alignment=ft.MainAxisAlignment.CENTER,
-                tight=True,
-                spacing=10,
-            ),
-            alignment=ft.alignment.center,
-            expand=True,
-            visible=True,
-        )
-
-        self._content_container = ft.Container(
-            content=ft.Stack(
-                controls=[
-                    ft.Container(expand=True),
-                    loading_overlay,
-                ],
-                expand=True,
-            ),
-            # Final size is set by _apply_responsive_size().
-            width=900,
-            height=500,
-            padding=ft.padding.all(12),
-            bgcolor=ft.Colors.WHITE,
-            border=ft.border.all(1, ft.Colors.BLACK12),
-            border_radius=10,
-        )
-
-        self._dlg = ft.AlertDialog(
-            modal=True,
-            title=self._title_text,
-            content=self._content_container,
-            actions=[
-                ft.Row(
-                    controls=[
-                        ft.ElevatedButton(
-                            "Publish all history",
-                            on_click=self._on_publish_all_history_click,
-                            color=ON_COLOR,
-                            bgcolor=ft.Colors.INDIGO_600,
-                        )
-                        if (self._use_sqlite and self.db_path is not None)
-                        else ft.Container(),
-                        ft.ElevatedButton(
-                            "Clean up sync files",
-                            on_click=self._on_cleanup_sync_files_click,
-                            color=ON_COLOR,
-                            bgcolor=ft.Colors.DEEP_ORANGE_600,
-                        )
-                        if (self._use_sqlite and self.db_path is not None)
-                        else ft.Container(),
-                        ft.TextButton(
-                            "Close",
-                            on_click=self.close,
-                            style=ft.ButtonStyle(color=ON_COLOR, bgcolor=DANGER),
-                        ),
-                    ],
-                    alignment=ft.MainAxisAlignment.END,
-                    spacing=8,
-                    wrap=True,
-                    run_spacing=8,
-                )
-            ],
-            actions_alignment=ft.MainAxisAlignment.END,
-            on_dismiss=self.close,
-        )
+        if self._tree_built and self._dlg is not None:
+            # Reopening: keep the dialog and table tree and reload only the
+            # rows. Load progress goes to the title until they are replaced.
+            self._apply_ui_config()
+            self._filter_seq += 1
+            self._cancel_filter_task()
+            if self._filter_tf is not None:
+                self._filter_tf.value = ""
+                self._filter_tf.disabled = False
+            if self._title_text is not None:
+                self._title_text.value = f"{self.title} (loading…)"
+            loading_text = self._title_text
+        else:
+            # Open a lightweight dialog immediately (prevents perceived "hang").
+            loading_text = self._build_loading_dialog()
 
         open_dialog(page, self._dlg)
 
@@ -428,20 +666,6 @@ class HistoryTableDialog:
                     try:
                         await asyncio.sleep(0.05)
                         self._apply_responsive_size()
-                        try:
-                            if self._content_container is not None:
-                                self._content_container.update()
-                        except Exception:
-                            pass
-                        try:
-                            if self._dlg is not None:
-                                self._dlg.update()
-                        except Exception:
-                            pass
-                        try:
-                            page.update()
-                        except Exception:
-                            pass
                     except Exception:
                         pass
 
@@ -449,6 +673,9 @@ class HistoryTableDialog:
         except Exception:
             pass
 
+        self._load_seq += 1
+        load_seq = self._load_seq
+
         async def _load_async():
             try:
                 # Start sync in the background so opening the dialog is fast.
@@ -468,32 +695,52 @@ class HistoryTableDialog:
                     except Exception:
                         sync_task = None
 
+                loop = asyncio.get_running_loop()
+
+                def _show_progress(n: int) -> None:
+                    try:
+                        loading_text.value = f"Loading history… {n:,} rows read"
+                        loading_text.update()
+                    except Exception:
+                        pass
+
+                def _report_progress(n: int) -> None:
+                    # Called on the reader thread; hand the count to the UI loop
+                    # so the dialog repaints while parsing continues.
+                    loop.call_soon_threadsafe(_show_progress, n)
+
                 def _read_source():
                     max_rows = self.max_rows if self.max_rows > 0 else 1000
                     if self._use_sqlite and self.db_path is not None:
-                        return read_history_tail(db_path=self.db_path, limit=max_rows)
-
-                    with self.csv_path.open("r", newline="", encoding="utf-8-sig") as f:
-                        reader = csv.DictReader(f)
-                        fieldnames = list(reader.fieldnames or [])
-                        tail = deque(maxlen=max_rows)
-                        total_rows = 0
-                        for row in reader:
-                            total_rows += 1
-                            tail.append(row)
-                        rows_data = list(tail)
-                    return fieldnames, total_rows, rows_data
-
-                fieldnames, total_rows, rows_data = await asyncio.to_thread(
-                    _read_source
+                        # Taken before the tail read: rows the sync imports
+                        # meanwhile are either in the tail or after this mark.
+                        try:
+                            max_row_id = read_history_max_row_id(db_path=self.db_path)
+                        except Exception:
+                            max_row_id = 0
+                        tail = read_history_tail(db_path=self.db_path, limit=max_rows)
+                        return max_row_id, tail
+                    return None, self._read_csv_tail(max_rows, _report_progress)
+
+                max_row_id, (fieldnames, total_rows, rows_data) = (
+                    await self._run_in_worker(_read_source)
                 )
+                if load_seq != self._load_seq:
+                    return
+                # Set here, after the staleness check: a superseded load must
+                # not move the delta-sync mark of the current one.
+                if max_row_id is not None:
+                    self._last_max_row_id = int(max_row_id)
 
                 self._total_rows = int(total_rows)
+                # The row lists are only ever replaced, never mutated in
+                # place, so base/visible/filtered can share one list.
                 if self._use_sqlite and self.db_path is not None:
-                    sorted_rows = list(rows_data)
+                    sorted_rows = rows_data
                 else:
-                    sorted_rows = self._sort_rows(list(rows_data))
-                self._base_rows_data = list(sorted_rows)
+                    sorted_rows = self._sort_rows(rows_data)
+                self._base_rows_data = sorted_rows
+                self._applied_query = ""
 
                 if not fieldnames:
                     snack(page, "History CSV has no header", kind="warning")
@@ -509,97 +756,18 @@ class HistoryTableDialog:
                     return
 
                 self._fieldnames = visible_fields
-                self._rows_data = list(sorted_rows)
-                self._filtered_rows_data = list(sorted_rows)
-
-                self._prev_on_resize = getattr(page, "on_resize", None)
-
-                self._filter_tf = ft.TextField(
-                    label="Search",
-                    hint_text="Type to search, then press Enter...",
-                    text_size=12,
-                    dense=True,
-                    on_submit=self._apply_filter,
-                    expand=True,
+                self._rows_data = sorted_rows
+                self._filtered_rows_data = sorted_rows
+                self._row_search_blobs = self._build_search_blobs(
+                    self._base_rows_data
                 )
-
-                self._dt = ft.DataTable(
-                    columns=[
-                        ft.DataColumn(
-                            ft.Container(
-                                content=ft.Text(
-                                    (
-                                        {
-                                            "link_up": "lu",
-                                            "func_location": "fl",
-                                            "date_field": "date",
-                                            "shift": "shift",
-                                        }.get(name, name)
-                                    ).upper(),
-                                    size=11,
-                                    weight=ft.FontWeight.W_600,
-                                ),
-                                width=self._get_column_width(name),
-                            )
-                        )
-                        for name in self._fieldnames
-                    ],
-                    rows=self._build_rows(
-                        self._filtered_rows_data,
-                        self._get_column_widths_snapshot(),
-                    ),
-                    border=ft.border.all(1, ft.Colors.BLACK12),
-                    heading_row_color=ft.Colors.BLUE_GREY_50,
-                    data_row_max_height=100,
-                    data_row_min_height=40,
-                    heading_row_height=34,
-                    vertical_lines=ft.BorderSide(1, ft.Colors.BLACK12),
-                    horizontal_lines=ft.BorderSide(1, ft.Colors.BLACK12),
-                    column_spacing=15,
-                    width=900,
+                self._rendered_count = min(
+                    len(self._filtered_rows_data), self._row_window_size()
                 )
 
-                new_content = ft.Column(
-                    controls=[
-                        ft.Row(
-                            [
-                                self._filter_tf,
-                                ft.Text(
-                                    str(
-                                        self.db_path
-                                        if self._use_sqlite
-                                        else self.csv_path
-                                    ),
-                                    size=11,
-                                    italic=True,
-                                ),
-                            ],
-                        ),
-                        ft.Container(
-                            content=ft.Column(
-                                controls=[
-                                    ft.Row(
-                                        controls=[self._dt],
-                                        scroll=ft.ScrollMode.AUTO,
-                                        alignment=ft.MainAxisAlignment.END,
-                                    )
-                                ],
-                                scroll=ft.ScrollMode.AUTO,
-                                expand=True,
-                            ),
-                            expand=True,
-                        ),
-                    ],
-                    expand=True,
-                    spacing=8,
-                    scroll=None,
-                    alignment=ft.MainAxisAlignment.START,
-                )
+                self._prev_on_resize = getattr(page, "on_resize", None)
 
-                # Keep the same container instance to avoid UID/assert issues.
-                if self._content_container is not None:
-                    self._content_container.content = new_content
-                    self._content_container.expand = True
+                self._mount_table()
 
                 # Update existing dialog instead of creating a new one.
                 if self._title_text is not None:
@@ -654,26 +822,26 @@ class HistoryTableDialog:
                 except Exception:
                     pass
 
-                self._apply_responsive_size()
-                self._apply_column_widths()
-
-                try:
-                    if self._content_container is not None:
-                        self._content_container.update()
-                except Exception:
-                    pass
-
-                try:
-                    if self._dlg is not None:
-                        self._dlg.update()
-                except Exception:
-                    pass
+                self._apply_responsive_size(update=False)
+                self._apply_column_widths(update=False)
 
+                # One page.update() sends the new content, actions and sizes.
                 try:
                     page.update()
                 except Exception:
                     pass
 
+                # Legacy CSV larger than the loaded tail: filters scan the
+                # whole file, so build its search index now on the worker.
+                if not (self._use_sqlite and self.db_path is not None):
+                    if not self._has_all_rows_loaded():
+                        prep = self._run_in_worker(
+                            self._prepare_csv_search, list(self._fieldnames)
+                        )
+                        prep.add_done_callback(
+                            partial(self._on_csv_search_ready, load_seq)
+                        )
+
                 # After initial render, wait for background sync and refresh.
                 if sync_task is not None:
 
@@ -681,7 +849,9 @@ class HistoryTableDialog:
                         try:
                             imported, exported = await sync_task
 
-                            # If dialog closed, do nothing.
+                            # Dialog closed or reopened since: do nothing.
+                            if load_seq != self._load_seq:
+                                return
                             try:
                                 if self._dlg is None or not bool(
                                     getattr(self._dlg, "open", False)
@@ -699,66 +869,38 @@ class HistoryTableDialog:
                             except Exception:
                                 q_now = ""
 
-                            if imported > 0 and not q_now:
+                            if imported > 0:
                                 try:
                                     max_rows = (
                                         self.max_rows if self.max_rows > 0 else 1000
                                     )
-                                    fn2, total2, rows2 = await asyncio.to_thread(
-                                        read_history_tail,
+                                    read_new = partial(
+                                        read_history_since,
                                         db_path=self.db_path,
+                                        after_row_id=self._last_max_row_id,
                                         limit=max_rows,
                                     )
+                                    max_id, total2, new_rows = (
+                                        await self._run_in_worker(read_new)
+                                    )
+                                    if load_seq != self._load_seq:
+                                        return
+                                    self._last_max_row_id = max(
+                                        self._last_max_row_id, int(max_id)
+                                    )
                                     self._total_rows = int(total2)
-                                    self._base_rows_data = list(rows2)
-                                    self._rows_data = list(rows2)
-                                    self._filtered_rows_data = list(rows2)
-                                    if fn2:
-                                        self._fieldnames = [
-                                            c
-                                            for c in fn2
-                                            if c not in self.hidden_columns
-                                        ]
-
-                                    if self._dt is not None:
-                                        # Rebuild columns if needed, otherwise refresh rows.
-                                        if len(self._dt.columns or []) != len(
-                                            self._fieldnames
-                                        ):
-                                            self._dt.columns = [
-                                                ft.DataColumn(
-                                                    ft.Container(
-                                                        content=ft.Text(
-                                                            (
-                                                                {
-                                                                    "link_up": "lu",
-                                                                    "func_location": "fl",
-                                                                    "date_field": "date",
-                                                                    "shift": "shift",
-                                                                }.get(name, name)
-                                                            ).upper(),
-                                                            size=11,
-                                                            weight=ft.FontWeight.W_600,
-                                                        ),
-                                                        width=self._get_column_width(
-                                                            name
-                                                        ),
-                                                    )
-                                                )
-                                                for name in self._fieldnames
-                                            ]
-
-                                        widths = self._get_column_widths_snapshot()
-                                        self._dt.rows = self._build_rows(
-                                            self._filtered_rows_data,
-                                            widths,
-                                        )
-                                        try:
-                                            self._dt.update()
-                                        except Exception:
-                                            pass
 
-                                    if self._title_text is not None:
+                                    merged = self._merge_new_rows(new_rows)
+                                    if merged and q_now:
+                                        # Re-run the active filter on the merged rows.
+                                        self._apply_filter(force=True)
+                                    elif merged:
+                                        self._filtered_rows_data = self._base_rows_data
+                                        if self._dt is not None:
+                                            widths = self._get_column_widths_snapshot()
+                                            self._render_rows(widths)
+
+                                    if not q_now and self._title_text is not None:
                                         self._title_text.value = f"{self.title} (showing {len(self._rows_data)} of {self._total_rows} rows)"
                                 except Exception:
                                     pass
@@ -782,7 +924,7 @@ class HistoryTableDialog:
                                 pass
 
                             try:
-                                self._apply_responsive_size()
+                                self._apply_responsive_size(update=False)
                             except Exception:
                                 pass
                             try:
@@ -825,22 +967,15 @@ class HistoryTableDialog:
                     limit=max_rows,
                 )
             else:
-                with self.csv_path.open("r", newline="", encoding="utf-8-sig") as f:
-                    reader = csv.DictReader(f)
-                    fieldnames = list(reader.fieldnames or [])
-                    tail = deque(maxlen=max_rows)
-                    total_rows = 0
-                    for row in reader:
-                        total_rows += 1
-                        tail.append(row)
-                    rows_data = list(tail)
+                fieldnames, total_rows, rows_data = self._read_csv_tail(max_rows)
 
             # Re-run the same setup path on the current thread by invoking the async logic body.
             # This keeps behavior consistent for older runtimes.
             # Note: no asyncio loop here; just perform the same steps inline.
             self._total_rows = int(total_rows)
-            sorted_rows = self._sort_rows(list(rows_data))
-            self._base_rows_data = list(sorted_rows)
+            sorted_rows = self._sort_rows(rows_data)
+            self._base_rows_data = sorted_rows
+            self._applied_query = ""
 
             if not fieldnames:
                 snack(page, "History CSV has no header", kind="warning")
@@ -852,94 +987,16 @@ class HistoryTableDialog:
                 return
 
             self._fieldnames = visible_fields
-            self._rows_data = list(sorted_rows)
-            self._filtered_rows_data = list(sorted_rows)
-
-            self._prev_on_resize = getattr(page, "on_resize", None)
-
-            self._filter_tf = ft.TextField(
-                label="Search",
-                hint_text="Type to search, then press Enter...",
-                text_size=12,
-                dense=True,
-                on_submit=self._apply_filter,
-                expand=True,
-            )
-
-            self._dt = ft.DataTable(
-                columns=[
-                    ft.DataColumn(
-                        ft.Container(
-                            content=ft.Text(
-                                (
-                                    {
-                                        "link_up": "lu",
-                                        "func_location": "fl",
-                                        "date_field": "date",
-                                        "shift": "shift",
-                                    }.get(name, name)
-                                ).upper(),
-                                size=11,
-                                weight=ft.FontWeight.W_600,
-                            ),
-                            width=self._get_column_width(name),
-                        )
-                    )
-                    for name in self._fieldnames
-                ],
-                rows=self._build_rows(
-                    self._filtered_rows_data,
-                    self._get_column_widths_snapshot(),
-                ),
-                border=ft.border.all(1, ft.Colors.BLACK12),
-                heading_row_color=ft.Colors.BLUE_GREY_50,
-                data_row_max_height=100,
-                data_row_min_height=40,
-                heading_row_height=34,
-                vertical_lines=ft.BorderSide(1, ft.Colors.BLACK12),
-                horizontal_lines=ft.BorderSide(1, ft.Colors.BLACK12),
-                column_spacing=15,
-                width=900,
+            self._rows_data = sorted_rows
+            self._filtered_rows_data = sorted_rows
+            self._row_search_blobs = self._build_search_blobs(self._base_rows_data)
+            self._rendered_count = min(
+                len(self._filtered_rows_data), self._row_window_size()
             )
 
-            new_content = ft.Column(
-                controls=[
-                    ft.Row(
-                        [
-                            self._filter_tf,
-                            ft.Text(
-                                str(
-                                    self.db_path if self._use_sqlite else self.csv_path
-                                ),
-                                size=11,
-                                italic=True,
-                            ),
-                        ],
-                    ),
-                    ft.Container(
-                        content=ft.Column(
-                            controls=[
-                                ft.Row(
-                                    controls=[self._dt],
-                                    scroll=ft.ScrollMode.AUTO,
-                                    alignment=ft.MainAxisAlignment.END,
-                                )
-                            ],
-                            scroll=ft.ScrollMode.AUTO,
-                            expand=True,
-                        ),
-                        expand=True,
-                    ),
-                ],
-                expand=True,
-                spacing=8,
-                scroll=None,
-                alignment=ft.MainAxisAlignment.START,
-            )
+            self._prev_on_resize = getattr(page, "on_resize", None)
 
-            if self._content_container is not None:
-                self._content_container.content = new_content
-                self._content_container.expand = True
+            self._mount_table()
 
             if self._title_text is not None:
                 self._title_text.value = f"{self.title} (showing {len(self._rows_data)} of {total_rows} rows)"
@@ -978,65 +1035,346 @@ class HistoryTableDialog:
             except Exception:
                 pass
 
-            self._apply_responsive_size()
-            self._apply_column_widths()
-
-            try:
-                if self._content_container is not None:
-                    self._content_container.update()
-            except Exception:
-                pass
-
-            try:
-                if self._dlg is not None:
-                    self._dlg.update()
-            except Exception:
-                pass
+            self._apply_responsive_size(update=False)
+            self._apply_column_widths(update=False)
             page.update()
         except Exception as ex:
             snack(page, f"Failed to read history: {ex}", kind="error")
 
-    def _read_filtered_rows(self, q: str) -> tuple[int | None, list[dict]]:
-        """Stream-read the full CSV and return (matches_total, last_matches)."""
-        q = str(q or "").strip()
-        if not q:
-            return 0, []
-
-        if self._use_sqlite and self.db_path is not None:
-            fields = list(self._fieldnames or [])
-            max_rows = self.max_rows if self.max_rows > 0 else 1000
-            if self._filter_no_count:
-                return (
-                    None,
-                    read_history_filtered_tail_no_count(
-                        db_path=self.db_path,
-                        q=q,
-                        fieldnames=fields,
-                        limit=max_rows,
-                    ),
-                )
-            return read_history_filtered_tail(
-                db_path=self.db_path,
-                q=q,
-                fieldnames=fields,
-                limit=max_rows,
-            )
-
-        max_rows = self.max_rows if self.max_rows > 0 else 1000
-        tail = deque(maxlen=max_rows)
-        matches_total = 0
-
-        with self.csv_path.open("r", newline="", encoding="utf-8-sig") as f:
-            reader = csv.DictReader(f)
-            for row in reader:
-                if self._row_matches(row, q):
-                    matches_total += 1
-                    tail.append(row)
+    def _build_loading_dialog(self) -> ft.Text:
+        """Create the dialog in its loading state; return the progress text."""
+        self._title_text = ft.Text(f"{self.title} (loading…)")
+        loading_ring = ft.ProgressRing()
+        loading_text = ft.Text("Loading history…", size=12)
 
-        return matches_total, list(tail)
+        loading_overlay = ft.Container(
+            content=ft.Column(
+                controls=[loading_ring, loading_text],
+                horizontal_alignment=ft.CrossAxisAlignment.CENTER,
+                alignment=ft.MainAxisAlignment.CENTER,
+                tight=True,
+                spacing=10,
+            ),
+            alignment=ft.alignment.center,
+            expand=True,
+            visible=True,
+        )
 
-    def _read_filtered_rows_for_fields(
-        self, q: str, fieldnames: list[str]
+        self._content_container = ft.Container(
+            content=ft.Stack(
+                controls=[
+                    ft.Container(expand=True),
+                    loading_overlay,
+                ],
+                expand=True,
+            ),
+            # Final size is set by _apply_responsive_size().
+            width=900,
+            height=500,
+            padding=ft.padding.all(12),
+            bgcolor=ft.Colors.WHITE,
+            border=ft.border.all(1, ft.Colors.BLACK12),
+            border_radius=10,
+        )
+
+        self._dlg = ft.AlertDialog(
+            modal=True,
+            title=self._title_text,
+            content=self._content_container,
+            actions=[
+                ft.Row(
+                    controls=[
+                        ft.ElevatedButton(
+                            "Publish all history",
+                            on_click=self._on_publish_all_history_click,
+                            color=ON_COLOR,
+                            bgcolor=ft.Colors.INDIGO_600,
+                        )
+                        if (self._use_sqlite and self.db_path is not None)
+                        else ft.Container(),
+                        ft.ElevatedButton(
+                            "Clean up sync files",
+                            on_click=self._on_cleanup_sync_files_click,
+                            color=ON_COLOR,
+                            bgcolor=ft.Colors.DEEP_ORANGE_600,
+                        )
+                        if (self._use_sqlite and self.db_path is not None)
+                        else ft.Container(),
+                        ft.TextButton(
+                            "Close",
+                            on_click=self.close,
+                            style=ft.ButtonStyle(color=ON_COLOR, bgcolor=DANGER),
+                        ),
+                    ],
+                    alignment=ft.MainAxisAlignment.END,
+                    spacing=8,
+                    wrap=True,
+                    run_spacing=8,
+                )
+            ],
+            actions_alignment=ft.MainAxisAlignment.END,
+            on_dismiss=self.close,
+        )
+
+        return loading_text
+
+    def _mount_table(self) -> None:
+        """Show the loaded rows, building the table tree only on the first load.
+
+        Reopening the dialog keeps the search field, DataTable and layout
+        controls; only the rows (and the columns, when the visible column set
+        changed) are replaced, so Flet re-sends rows instead of a whole new
+        content tree.
+        """
+        reuse = self._tree_built and self._dt is not None
+        rows = self._build_rows(
+            self._filtered_rows_data[: self._rendered_count],
+            self._get_column_widths_snapshot(),
+            recycle=self._dt.rows if reuse else None,
+        )
+        fields = tuple(self._fieldnames)
+        if reuse:
+            if self._dt_fieldnames != fields:
+                self._dt.columns = self._build_table_columns()
+                self._dt_fieldnames = fields
+            self._dt.rows = rows
+            return
+
+        self._filter_tf = ft.TextField(
+            label="Search",
+            hint_text="Type to search...",
+            text_size=12,
+            dense=True,
+            on_change=self._on_filter_change,
+            on_submit=self._apply_filter,
+            expand=True,
+        )
+
+        self._dt = ft.DataTable(
+            columns=self._build_table_columns(),
+            rows=rows,
+            border=ft.border.all(1, ft.Colors.BLACK12),
+            heading_row_color=ft.Colors.BLUE_GREY_50,
+            data_row_max_height=100,
+            data_row_min_height=self._row_min_height_px,
+            heading_row_height=34,
+            vertical_lines=ft.BorderSide(1, ft.Colors.BLACK12),
+            horizontal_lines=ft.BorderSide(1, ft.Colors.BLACK12),
+            column_spacing=15,
+            data_text_style=self._cell_text_style,
+            width=900,
+        )
+        self._dt_fieldnames = fields
+
+        new_content = ft.Column(
+            controls=[
+                ft.Row(
+                    [
+                        self._filter_tf,
+                        ft.Text(
+                            str(self.db_path if self._use_sqlite else self.csv_path),
+                            size=11,
+                            italic=True,
+                        ),
+                    ],
+                ),
+                ft.Container(
+                    content=ft.Column(
+                        controls=[
+                            ft.Row(
+                                controls=[self._dt],
+                                scroll=ft.ScrollMode.AUTO,
+                                alignment=ft.MainAxisAlignment.END,
+                            )
+                        ],
+                        scroll=ft.ScrollMode.AUTO,
+                        expand=True,
+                        on_scroll=self._on_table_scroll,
+                        # Window appends/trims only need a coarse position;
+                        # the default 10 ms sends an event per frame.
+                        on_scroll_interval=self._scroll_event_interval_ms,
+                    ),
+                    expand=True,
+                ),
+            ],
+            expand=True,
+            spacing=8,
+            scroll=None,
+            alignment=ft.MainAxisAlignment.START,
+        )
+
+        # Keep the same container instance to avoid UID/assert issues.
+        if self._content_container is not None:
+            self._content_container.content = new_content
+            self._content_container.expand = True
+        self._tree_built = True
+
+    def _build_table_columns(self) -> list[ft.DataColumn]:
+        col_widths = self._column_widths_list(self._get_column_widths_snapshot())
+        self._header_containers = [
+            ft.Container(
+                content=ft.Text(
+                    self._HEADER_LABELS.get(name, name.upper()),
+                    size=11,
+                    weight=ft.FontWeight.W_600,
+                ),
+                width=w,
+            )
+            for name, w in zip(self._fieldnames, col_widths)
+        ]
+        return [ft.DataColumn(box) for box in self._header_containers]
+
+    def _read_csv_tail(
+        self, max_rows: int, progress: Callable[[int], None] | None = None
+    ) -> tuple[list[str], int, list[dict]]:
+        """Read the CSV and return (fieldnames, total_rows, tail_rows).
+
+        Rows are kept as the plain lists csv.reader yields and stored in the
+        same cache the CSV filter uses (_csv_rows_cache), so the first filter
+        after a load does not parse the file again. Only the rows that
+        survive in the tail are turned into dicts (short rows are padded
+        with "" so every dict carries every header key).
+
+        `progress`, when given, is called with the running row count every
+        `_csv_progress_rows` rows (from the reading thread).
+
+        A large file with a cold cache is first tried with a backward tail
+        read (_read_csv_tail_backward), leaving the full parse to the
+        search warm-up queued after the load.
+        """
+        st = self.csv_path.stat()
+        stamp = (st.st_mtime_ns, st.st_size)
+        cached = self._csv_rows_cache
+        if cached is not None and cached[0] == stamp:
+            _stamp, fieldnames, all_rows = cached
+        else:
+            if max_rows > 0 and st.st_size >= self._csv_tail_seek_min_bytes:
+                fast = self._read_csv_tail_backward(max_rows)
+                if fast is not None:
+                    fieldnames, total_rows, tail = fast
+                    return (
+                        fieldnames,
+                        total_rows,
+                        self._raw_rows_to_dicts(fieldnames, tail),
+                    )
+            fieldnames, all_rows = self._parse_csv_file(stamp, progress)
+
+        total_rows = len(all_rows)
+        tail = all_rows[-max_rows:] if max_rows > 0 else []
+        return fieldnames, total_rows, self._raw_rows_to_dicts(fieldnames, tail)
+
+    def _read_csv_tail_backward(
+        self, max_rows: int
+    ) -> tuple[list[str], int, list[list[str]]] | None:
+        """Read only the last `max_rows` CSV rows, walking back from the end.
+
+        Returns (header, estimated_total, tail_rows), or None when the tail
+        cannot be split safely this way: a quote in the tail bytes means a
+        newline there may sit inside a quoted field, and a file with too few
+        lines is cheaper to parse whole. The total is the body's newline
+        count (exact unless rows span lines or blank lines exist); the full
+        parse queued after the load replaces it with the exact count.
+        """
+        step = 1 << 16
+        with self.csv_path.open("rb") as f:
+            header_line = f.readline()
+            body_start = f.tell()
+            size = f.seek(0, io.SEEK_END)
+
+            chunks: list[bytes] = []
+            newlines = 0
+            pos = size
+            while pos > body_start and newlines <= max_rows + 1:
+                read_from = max(body_start, pos - step)
+                f.seek(read_from)
+                chunk = f.read(pos - read_from)
+                chunks.append(chunk)
+                newlines += chunk.count(b"\n")
+                pos = read_from
+            if pos <= body_start:
+                return None
+            buf = b"".join(reversed(chunks))
+            if b'"' in buf:
+                return None
+
+            # The first line in the buffer is partial; rows start after it.
+            text = buf[buf.find(b"\n") + 1 :].decode("utf-8")
+            tail = [r for r in csv.reader(io.StringIO(text, newline="")) if r]
+            if len(tail) < max_rows:
+                return None
+            tail = tail[-max_rows:]
+
+            f.seek(body_start)
+            total = 0
+            read = f.read
+            for block in iter(partial(read, 1 << 20), b""):
+                total += block.count(b"\n")
+            if not buf.endswith(b"\n"):
+                total += 1
+
+        header = next(csv.reader([header_line.decode("utf-8-sig")]), [])
+        return header, total, tail
+
+    @staticmethod
+    def _raw_rows_to_dicts(
+        header: list[str], raw_rows: Iterable[list[str]]
+    ) -> list[dict]:
+        """Turn csv.reader rows into dicts keyed by `header`.
+
+        Short rows are padded with "" so every dict carries every header key
+        (like csv.DictReader). Only rows that are displayed go through here;
+        the cache keeps the raw lists.
+        """
+        n = len(header)
+        pad = [""] * n
+        return [
+            dict(zip(header, r if len(r) >= n else r + pad[len(r) :]))
+            for r in raw_rows
+        ]
+
+    def _parse_csv_file(
+        self,
+        stamp: tuple[int, int],
+        progress: Callable[[int], None] | None = None,
+    ) -> tuple[list[str], list[list[str]]]:
+        """Parse the whole CSV with csv.reader and store it in _csv_rows_cache.
+
+        Values of the low-cardinality columns (_INTERN_COLUMNS) are interned
+        so the many repeats of a shift/user/date share one string object
+        instead of one copy per row.
+        """
+        step = max(1, int(self._csv_progress_rows))
+        rows: list[list[str]] = []
+        append = rows.append
+        # The file is read front to back once: a 1 MiB buffer (same as the
+        # export writers) keeps the read syscalls few on large files.
+        with self.csv_path.open(
+            "r", newline="", encoding="utf-8-sig", buffering=1 << 20
+        ) as f:
+            reader = csv.reader(f)
+            header = next(reader, [])
+            intern_idx = [i for i, c in enumerate(header) if c in _INTERN_COLUMNS]
+            for row in reader:
+                # Match csv.DictReader: blank lines are not rows.
+                if not row:
+                    continue
+                n = len(row)
+                for i in intern_idx:
+                    if i < n:
+                        row[i] = intern(row[i])
+                append(row)
+                if progress is not None and len(rows) % step == 0:
+                    try:
+                        progress(len(rows))
+                    except Exception:
+                        pass
+        if self._job_is_current():
+            self._csv_rows_cache = (stamp, header, rows)
+            self._csv_corpus_cache = None
+        return header, rows
+
+    def _read_filtered_rows_for_fields(
+        self, q: str, fieldnames: list[str]
     ) -> tuple[int | None, list[dict]]:
         """Thread-friendly variant: uses provided fieldnames snapshot."""
         q = str(q or "").strip()
@@ -1062,33 +1400,142 @@ class HistoryTableDialog:
                 limit=max_rows,
             )
 
-        max_rows = self.max_rows if self.max_rows > 0 else 1000
-        tail = deque(maxlen=max_rows)
-        matches_total = 0
+        return self._filter_csv_rows(q, list(fieldnames or []))
+
+    def _filter_csv_rows(self, q: str, fieldnames: list[str]) -> tuple[int, list[dict]]:
+        """Return (matches_total, last_matches) over the cached CSV rows.
 
+        Matches are found as row indices with one scan over the joined blob
+        string (see _find_in_corpus); rows stay as the lists csv.reader
+        yields and only the returned tail is turned into dicts (see
+        _raw_rows_to_dicts).
+        """
+        max_rows = self.max_rows if self.max_rows > 0 else 1000
         q_l = q.lower()
+        header, rows, text, starts = self._get_csv_rows_and_corpus(fieldnames)
+        last = self._csv_last_scan
+        if (
+            last is not None
+            and last[0] is text
+            and last[1] in q_l
+            and len(last[2]) * 8 < len(starts)
+        ):
+            # The query extends the previous one: only its matches can still
+            # match. Worth it while they are a small share of the rows; a
+            # broad previous result is faster to redo as one corpus scan.
+            idx = _find_in_corpus_rows(text, starts, q_l, last[2])
+        elif _CORPUS_SEP in q_l:
+            # The query could span rows in the corpus: search row by row.
+            idx = _find_in_corpus_rows(text, starts, q_l, range(len(starts)))
+        else:
+            idx = _find_in_corpus(text, starts, q_l)
+        if self._job_is_current():
+            self._csv_last_scan = (text, q_l, idx)
+
+        tail = self._raw_rows_to_dicts(header, map(rows.__getitem__, idx[-max_rows:]))
+        return len(idx), tail
+
+    def _get_csv_rows_and_corpus(
+        self, fieldnames: list[str]
+    ) -> tuple[list[str], list[list[str]], str, list[int]]:
+        """Return (header, raw_rows, corpus_text, row_starts) for the legacy CSV.
+
+        Rows are parsed once with csv.reader and reused while the file is
+        unchanged (keyed by mtime and size, so a write to the history CSV
+        triggers a fresh parse). Blobs are built by column position for
+        `fieldnames`, joined into the corpus and dropped; the corpus is kept
+        for the last column set it was built for.
+        """
+        st = self.csv_path.stat()
+        stamp = (st.st_mtime_ns, st.st_size)
+        cached = self._csv_rows_cache
+        if cached is not None and cached[0] == stamp:
+            _stamp, header, rows = cached
+        else:
+            header, rows = self._parse_csv_file(stamp)
+
+        fields = tuple(fieldnames)
+        corpus_cached = self._csv_corpus_cache
+        if corpus_cached is not None and corpus_cached[0] is rows:
+            if corpus_cached[1] == fields:
+                return header, rows, corpus_cached[2], corpus_cached[3]
+
+        # Same blob layout as _build_search_blobs; columns missing from the
+        # header (or from a short row) contribute "".
+        col_idx = {name: i for i, name in enumerate(header)}
+        idxs = [col_idx.get(c, -1) for c in fields]
+        join = "\x1f".join
+
+        def _blob(r: list[str]) -> str:
+            return join(r[i] if 0 <= i < len(r) else "" for i in idxs).lower()
+
+        if len(idxs) > 1 and min(idxs) >= 0:
+            # Every column is in the header: full-length rows (the normal
+            # case) take all their values with one C-level itemgetter call.
+            get_values = itemgetter(*idxs)
+            need = max(idxs) + 1
+            blobs = [
+                join(get_values(r)).lower() if len(r) >= need else _blob(r)
+                for r in rows
+            ]
+        else:
+            blobs = [_blob(r) for r in rows]
+        text, starts = _build_corpus(blobs)
+        if self._job_is_current():
+            self._csv_corpus_cache = (rows, fields, text, starts)
+        return header, rows, text, starts
+
+    def _run_in_worker(self, fn: Callable, *args) -> asyncio.Future:
+        """Run `fn(*args)` on the dialog's single worker thread.
+
+        One worker for the dialog's whole lifetime instead of a default-pool
+        thread per call: load/filter jobs run one at a time in submission
+        order (so they never race on the dialog's caches), and a queued job
+        can still be cancelled. The executor is never replaced, so a job
+        still running when the dialog is closed and reopened shares the
+        thread with the new load's jobs instead of running beside them.
+        """
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=1, thread_name_prefix="history-table"
+            )
+        load_seq = self._load_seq
+        state = self._worker_state
 
-        def _row_matches_fields(row_obj: dict) -> bool:
+        def _job():
+            state.load_seq = load_seq
             try:
-                for col in fieldnames:
-                    v = str((row_obj or {}).get(col, "") or "")
-                    if q_l in v.lower():
-                        return True
-            except Exception:
-                return True
-            return False
-
-        with self.csv_path.open("r", newline="", encoding="utf-8-sig") as f:
-            reader = csv.DictReader(f)
-            for row in reader:
-                if _row_matches_fields(row):
-                    matches_total += 1
-                    tail.append(row)
-
-        return matches_total, list(tail)
+                return fn(*args)
+            finally:
+                state.load_seq = None
+
+        loop = asyncio.get_running_loop()
+        fut = loop.run_in_executor(self._executor, _job)
+        self._worker_futures.add(fut)
+        fut.add_done_callback(self._worker_futures.discard)
+        return fut
+
+    def _job_is_current(self) -> bool:
+        """False inside a worker job submitted before the last close()/show().
+
+        Such a job may still finish, but must not write the dialog's caches
+        or marks over those of the current load. Outside a worker job (UI
+        thread) this is always True.
+        """
+        load_seq = getattr(self._worker_state, "load_seq", None)
+        return load_seq is None or load_seq == self._load_seq
 
     def close(self, _e=None):
         page = self.page
+        self._load_seq += 1
+        # Drop queued jobs; one already running finishes on the same worker
+        # (its cache writes are skipped, see _job_is_current). close() can run
+        # on a handler thread, so the cancel is handed to the futures' loop.
+        try:
+            for fut in list(self._worker_futures):
+                fut.get_loop().call_soon_threadsafe(fut.cancel)
+        except Exception:
+            pass
         try:
             if self._dlg is not None:
                 self._dlg.open = False
@@ -1101,6 +1548,8 @@ class HistoryTableDialog:
             pass
 
     def _ensure_file_picker_added(self):
+        if self._picker_attached:
+            return
         page = self.page
         try:
             overlay = getattr(page, "overlay", None)
@@ -1108,6 +1557,7 @@ class HistoryTableDialog:
                 return
             if self._file_picker not in overlay:
                 overlay.append(self._file_picker)
+            self._picker_attached = True
             page.update()
         except Exception:
             pass
@@ -1234,9 +1684,10 @@ class HistoryTableDialog:
             if not p:
                 return
 
-            # Snapshot data on UI thread
+            # Snapshot data on UI thread. The row list is only ever replaced,
+            # never mutated in place, so the writer can stream it directly.
             fieldnames = list(self._fieldnames or [])
-            rows_data = list(self._filtered_rows_data or [])
+            rows_data = self._filtered_rows_data or []
 
             export_mode = str(getattr(self, "_export_mode", "view") or "view").strip()
             use_sqlite = bool(self._use_sqlite and self.db_path is not None)
@@ -1270,15 +1721,7 @@ class HistoryTableDialog:
                             return exported, matches_total
 
                         # Default: export current view snapshot.
-                        with open(p, "w", newline="", encoding="utf-8-sig") as f:
-                            writer = csv.DictWriter(f, fieldnames=fieldnames)
-                            writer.writeheader()
-                            for row_obj in rows_data:
-                                out = {
-                                    c: str((row_obj or {}).get(c, "") or "")
-                                    for c in fieldnames
-                                }
-                                writer.writerow(out)
+                        self._write_rows_csv(p, fieldnames, rows_data)
                         return len(rows_data), len(rows_data)
 
                     exported, matches_total = await asyncio.to_thread(_worker_write)
@@ -1312,181 +1755,650 @@ class HistoryTableDialog:
                         kind="success",
                     )
                 else:
-                    with open(p, "w", newline="", encoding="utf-8-sig") as f:
-                        writer = csv.DictWriter(f, fieldnames=fieldnames)
-                        writer.writeheader()
-                        for row_obj in rows_data:
-                            out = {
-                                c: str((row_obj or {}).get(c, "") or "")
-                                for c in fieldnames
-                            }
-                            writer.writerow(out)
+                    self._write_rows_csv(p, fieldnames, rows_data)
                     snack(page, f"Export successful: {p}", kind="success")
         except Exception as ex:
             snack(page, f"Failed to export CSV: {ex}", kind="error")
 
-    def _row_matches(self, row_obj: dict, q: str) -> bool:
-        if not q:
-            return True
-        q = q.lower()
+    @staticmethod
+    def _write_rows_csv(
+        path: str, fieldnames: list[str], rows: Iterable[dict]
+    ) -> None:
+        """Write rows to CSV in `fieldnames` order (1 MiB write buffer).
+
+        Loaded rows already hold str values (CSV text or normalized DB rows)
+        and csv.writer writes None as "", so each row's values go straight
+        to the C writer without a per-cell str() conversion.
+        """
+        defaults = [""] * len(fieldnames)
+        with open(path, "w", newline="", encoding="utf-8-sig", buffering=1 << 20) as f:
+            writer = csv.writer(f)
+            writer.writerow(fieldnames)
+            writer.writerows(map(r.get, fieldnames, defaults) for r in rows)
+
+    def _build_search_blobs(
+        self, rows: list[dict], fieldnames: list[str] | None = None
+    ) -> list[str]:
+        """Return one lowercased search string per row (visible columns only).
+
+        Columns are joined with a unit separator so a query can never match
+        across a column boundary, which keeps the per-column search semantics.
+        """
+        if fieldnames is None:
+            fieldnames = self._fieldnames
+        fields = list(fieldnames or [])
+        # Loaded rows are always dicts: fetch each row's values with a C-level
+        # map over r.get instead of a per-cell generator step.
+        defaults = [""] * len(fields)
+        join = "\x1f".join
+        return [join(map(r.get, fields, defaults)).lower() for r in rows]
+
+    def _merge_new_rows(self, new_rows: list[dict]) -> bool:
+        """Merge rows added by a sync into the loaded base rows.
+
+        Rows already loaded (same save_id and indexes) are skipped; the union
+        is re-sorted and capped at max_rows. Existing rows keep their search
+        blob and cached DataRow, only the new ones are built.
+        Returns False when nothing new was merged.
+        """
+
+        def _row_key(r: dict) -> tuple[str, str, str, str]:
+            return (
+                str(r.get("save_id", "") or ""),
+                str(r.get("card_index", "") or ""),
+                str(r.get("detail_index", "") or ""),
+                str(r.get("action_index", "") or ""),
+            )
+
+        base = self._base_rows_data
+        seen = {_row_key(r) for r in base}
+        fresh = [r for r in (new_rows or []) if _row_key(r) not in seen]
+        if not fresh:
+            return False
+
+        blob_by_id: dict[int, str] = {}
+        if len(self._row_search_blobs) == len(base):
+            blob_by_id = {id(r): b for r, b in zip(base, self._row_search_blobs)}
+        blob_by_id.update(zip(map(id, fresh), self._build_search_blobs(fresh)))
+
+        max_rows = self.max_rows if self.max_rows > 0 else 1000
+        merged = self._sort_rows(fresh + base)[:max_rows]
+        self._base_rows_data = merged
+        self._rows_data = merged
+        blobs = [blob_by_id.get(id(r)) for r in merged]
+        if any(b is None for b in blobs):
+            blobs = self._build_search_blobs(merged)
+        self._row_search_blobs = blobs
+        return True
+
+    def _has_all_rows_loaded(self) -> bool:
+        """True when the loaded base rows already cover the whole source."""
+        n = len(self._base_rows_data)
+        return n == len(self._row_search_blobs) and n >= int(self._total_rows or 0)
+
+    def _filter_loaded_rows(self, q: str) -> list[dict]:
+        """Filter the loaded base rows with one substring test per row.
+
+        When the query extends the previous one (e.g. "erro" -> "error"),
+        only the previous matches are rescanned.
+        """
+        q_l = str(q or "").lower()
+        blobs = self._row_search_blobs
+        candidates: range | list[int] = range(len(blobs))
+        cache = self._last_filter_cache
+        if cache is not None and cache[0] is blobs and cache[1] in q_l:
+            candidates = cache[2]
+
+        if isinstance(candidates, range) and _CORPUS_SEP not in q_l:
+            idx = self._scan_blob_corpus(blobs, q_l)
+        else:
+            idx = [i for i in candidates if q_l in blobs[i]]
+        if self._job_is_current():
+            self._last_filter_cache = (blobs, q_l, idx)
+        return list(map(self._base_rows_data.__getitem__, idx))
+
+    def _remember_matches(
+        self,
+        q: str,
+        fieldnames: list[str],
+        matches_total: int | None,
+        matches: list[dict],
+    ) -> None:
+        """Keep a CSV/DB filter result for _refine_last_matches if complete.
+
+        Results are capped at max_rows; a capped result cannot be refined.
+        """
+        max_rows = self.max_rows if self.max_rows > 0 else 1000
+        if not self._can_refine_query(str(q)):
+            if self._job_is_current():
+                self._last_full_matches = None
+            return
+        if matches_total is None:
+            complete = len(matches) < max_rows
+        else:
+            complete = len(matches) >= int(matches_total)
+        if not self._job_is_current():
+            return
+        if not complete:
+            self._last_full_matches = None
+            return
+        self._last_full_matches = (
+            self._base_rows_data,
+            str(q).lower(),
+            tuple(fieldnames),
+            matches_total,
+            list(matches),
+            None,
+        )
+
+    def _refine_last_matches(
+        self, q: str, fieldnames: list[str]
+    ) -> tuple[int | None, list[dict]] | None:
+        """Answer a narrowing query from the last complete CSV/DB result.
+
+        When the new query contains the previous one, its matches are a subset
+        of the previous matches, so only those rows are re-tested. Returns
+        None when the cached result does not apply (different columns, data
+        reloaded since, or a non-narrowing query).
+        """
+        last = self._last_full_matches
+        q_l = str(q).lower()
+        if last is None or not self._can_refine_query(q_l):
+            return None
+        base, last_q, last_fields, last_total, last_matches, last_blobs = last
+        if base is not self._base_rows_data or last_fields != tuple(fieldnames):
+            return None
+        if not last_q or last_q not in q_l:
+            return None
+
+        # Lowercased blobs are built once for a result and then narrowed
+        # together with it, so further keystrokes only run substring tests.
+        if last_blobs is None:
+            last_blobs = self._build_search_blobs(last_matches, list(fieldnames))
+        keep = [i for i, blob in enumerate(last_blobs) if q_l in blob]
+        matches = list(map(last_matches.__getitem__, keep))
+        blobs = list(map(last_blobs.__getitem__, keep))
+        if not self._job_is_current():
+            return (None if last_total is None else len(matches)), matches
+        self._last_full_matches = (
+            base,
+            q_l,
+            last_fields,
+            last_total,
+            matches,
+            blobs,
+        )
+        return (None if last_total is None else len(matches)), matches
+
+    def _get_blob_corpus(self, blobs: list[str]) -> tuple[list[str], str, list[int]]:
+        """Return (blobs, joined text, row start offsets), kept for `blobs`."""
+        corpus = self._blob_corpus
+        if corpus is None or corpus[0] is not blobs:
+            corpus = (blobs, *_build_corpus(blobs))
+            if self._job_is_current():
+                self._blob_corpus = corpus
+        return corpus
+
+    def _prepare_csv_search(self, fieldnames: list[str]) -> int | None:
+        """Worker job: build the CSV search corpus ahead of a filter.
+
+        Queued right after a CSV load, so the first keystroke only has to
+        scan the corpus instead of also building it from every parsed row.
+        Returns the exact row count (None on failure).
+        """
         try:
-            for col in self._fieldnames:
-                v = str((row_obj or {}).get(col, "") or "")
-                if q in v.lower():
-                    return True
+            _header, rows, _text, _starts = self._get_csv_rows_and_corpus(fieldnames)
+            return len(rows)
         except Exception:
-            return True
-        return False
+            return None
+
+    def _on_csv_search_ready(self, load_seq: int, fut: asyncio.Future) -> None:
+        """Replace the estimated CSV row count once the full parse is done.
+
+        A backward tail read (_read_csv_tail_backward) only estimates the
+        total from the file's line count; the parse gives the exact figure.
+        """
+        try:
+            if fut.cancelled() or load_seq != self._load_seq:
+                return
+            total = fut.result()
+            if total is None or total == self._total_rows:
+                return
+            self._total_rows = int(total)
+            if self._applied_query == "" and self._title_text is not None:
+                self._title_text.value = f"{self.title} (showing {len(self._rows_data)} of {self._total_rows} rows)"
+                self._title_text.update()
+        except Exception:
+            pass
+
+    def _scan_blob_corpus(self, blobs: list[str], q_l: str) -> list[int]:
+        """Return indices of blobs containing `q_l`, scanning one joined string.
+
+        See _find_in_corpus; the corpus is kept for the last `blobs` list.
+        """
+        if not blobs:
+            return []
+        _blobs, text, starts = self._get_blob_corpus(blobs)
+        return _find_in_corpus(text, starts, q_l)
 
     def _get_column_widths_snapshot(self) -> dict[str, int]:
-        """Return a dict of column widths for current fieldnames."""
+        """Return a dict of column widths for current fieldnames.
+
+        Widths only depend on the stretch width (derived from the container
+        width) and the column set, so the snapshot is memoized on those.
+        Callers must treat the returned dict as read-only.
+        """
+        key = (int(self._stretch_width_px), tuple(self._fieldnames))
+        cached = self._widths_snapshot_cache
+        if cached is not None and cached[0] == key:
+            return cached[1]
+
         widths: dict[str, int] = {}
         for col in self._fieldnames:
             try:
                 widths[col] = int(self._get_column_width(col))
             except Exception:
                 widths[col] = int(self._default_fixed_width_px)
+        self._widths_snapshot_cache = (key, widths)
+        # Built in _fieldnames order, so (with no duplicate names) the values
+        # are already the positional list _column_widths_list would compute.
+        if len(widths) == len(self._fieldnames):
+            self._widths_list_cache = (widths, list(widths.values()))
         return widths
 
+    def _column_widths_list(self, widths: dict[str, int]) -> list[int]:
+        """Return `widths` as a list aligned with _fieldnames.
+
+        Cell loops index this list instead of doing a dict lookup per cell.
+        Memoized for the last snapshot dict it was built from.
+        """
+        cached = self._widths_list_cache
+        if cached is not None and cached[0] is widths:
+            return cached[1]
+        default_w = self._default_fixed_width_px
+        out = [int(widths.get(c, default_w)) for c in self._fieldnames]
+        self._widths_list_cache = (widths, out)
+        return out
+
     def _build_rows(
-        self, filtered: list[dict], widths: dict[str, int] | None = None
+        self,
+        filtered: list[dict],
+        widths: dict[str, int] | None = None,
+        recycle: list[ft.DataRow] | None = None,
     ) -> list[ft.DataRow]:
-        out_rows: list[ft.DataRow] = []
+        """Return DataRows for `filtered`, reusing existing controls.
+
+        A row rendered before (same dict, same columns) gets its cached
+        DataRow back, with its cell widths updated if they changed since.
+        Other rows take over a DataRow from `recycle` (the rows leaving the
+        table) by updating its texts, widths and colour in place, so Flet
+        sends changed values instead of new controls. Controls are only built
+        when no recyclable row is left.
+        """
         if widths is None:
             widths = self._get_column_widths_snapshot()
+
+        # Cached rows are only valid for the column set they were built for;
+        # a width change is applied to a cached row when it is reused.
+        col_widths = self._column_widths_list(widths)
+        layout = tuple(self._fieldnames)
+        cache = self._row_control_cache
+        if self._row_control_cache_layout != layout:
+            cache.clear()
+            self._row_control_cache_layout = layout
+        elif len(cache) > self._row_control_cache_max:
+            cache.clear()
+
+        # Bound once: these run per row, for every row of the window.
+        out_rows: list = []
+        misses: list[tuple[int, dict]] = []
+        cache_get = cache.get
+        append_row = out_rows.append
+        append_miss = misses.append
         for row_obj in filtered:
-            row_color = None
+            hit = cache_get(id(row_obj))
+            if hit is not None and hit[0] is row_obj:
+                data_row = hit[1]
+                if hit[2] is not col_widths and hit[2] != col_widths:
+                    for cell, w in zip(data_row.cells, col_widths):
+                        cell.content.width = w
+                    cache[id(row_obj)] = (row_obj, data_row, col_widths)
+                append_row(data_row)
+            else:
+                append_miss((len(out_rows), row_obj))
+                append_row(None)
+        if not misses:
+            return out_rows
+
+        free: list[ft.DataRow] = []
+        if recycle:
+            kept = {id(r) for r in out_rows if r is not None}
+            n_cols = len(col_widths)
+            free = [
+                r
+                for r in recycle
+                if id(r) not in kept and len(r.cells or []) == n_cols
+            ]
+
+        read_row = self._get_row_reader()
+        DataRow, DataCell, Container, Text = (
+            ft.DataRow,
+            ft.DataCell,
+            ft.Container,
+            ft.Text,
+        )
+        shift_colors: dict[str, str | None] = {}
+
+        for pos, row_obj in misses:
+            values, shift_raw = read_row(row_obj)
+            # A table has only a handful of distinct shift labels, so each is
+            # classified once per call and then looked up.
+            shift_key = _to_str(shift_raw)
+            if shift_key in shift_colors:
+                row_color = shift_colors[shift_key]
+            else:
+                row_color = _shift_row_color(shift_key.strip().lower())
+                shift_colors[shift_key] = row_color
+
+            if free:
+                data_row = free.pop()
+                for cell, v, w in zip(data_row.cells, values, col_widths):
+                    box = cell.content
+                    box.width = w
+                    box.content.value = v
+                data_row.color = row_color
+                # The row it showed before loses its cache entry.
+                old = data_row.data
+                entry = cache_get(id(old))
+                if entry is not None and entry[1] is data_row:
+                    del cache[id(old)]
+            else:
+                cells = [
+                    DataCell(Container(content=Text(v), width=w))
+                    for v, w in zip(values, col_widths)
+                ]
+                if row_color is None:
+                    data_row = DataRow(cells=cells)
+                else:
+                    data_row = DataRow(cells=cells, color=row_color)
+            # Python-side only (not sent to the client): the row shown.
+            data_row.data = row_obj
+            cache[id(row_obj)] = (row_obj, data_row, col_widths)
+            out_rows[pos] = data_row
+        return out_rows
+
+    def _get_row_reader(self) -> Callable[[dict], tuple[tuple, object]]:
+        """Return a reader of (visible values, shift value) for a row.
+
+        The column set is fixed for the life of the dialog, so the reader
+        pulls all visible values with one itemgetter call instead of a
+        per-column .get() loop; the shift is read from the same positional
+        tuple when it is a visible column. Rebuilt only when _fieldnames
+        changes.
+        """
+        fields = tuple(self._fieldnames)
+        cached = self._cells_builder
+        if cached is not None and cached[0] == fields:
+            return cached[1]
+
+        get_values = itemgetter(*fields) if fields else None
+        single = len(fields) == 1
+        shift_pos = fields.index("shift") if "shift" in fields else -1
+
+        def _read_row(row_obj: dict) -> tuple[tuple, object]:
             try:
-                shift_v = str((row_obj or {}).get("shift", "") or "").strip()
-                shift_l = shift_v.lower()
-                if shift_l:
-                    if "all" in shift_l and "shift" in shift_l:
-                        row_color = ft.Colors.INDIGO_50
-                    else:
-                        m = re.search(r"\d+", shift_l)
-                        n = int(m.group(0)) if m else None
-                        if n == 1:
-                            row_color = ft.Colors.RED_50
-                        elif n == 2:
-                            row_color = ft.Colors.GREEN_50
-                        elif n == 3:
-                            row_color = ft.Colors.YELLOW_50
-                        else:
-                            row_color = ft.Colors.BLUE_GREY_50
+                values = get_values(row_obj) if get_values is not None else ()
+                if single:
+                    values = (values,)
             except Exception:
-                row_color = None
-
-            cells: list[ft.DataCell] = []
-            for col in self._fieldnames:
-                try:
-                    value = str((row_obj or {}).get(col, "") or "")
-                except Exception:
-                    value = ""
-                w = int(widths.get(col, self._default_fixed_width_px))
-                cells.append(
-                    ft.DataCell(
-                        ft.Container(
-                            content=ft.Text(value, size=11),
-                            width=w,
-                        )
-                    )
-                )
-            if row_color is None:
-                out_rows.append(ft.DataRow(cells=cells))
+                # Missing keys / non-dict rows: fall back to tolerant lookups.
+                src = row_obj if isinstance(row_obj, dict) else {}
+                values = tuple(src.get(c, "") for c in fields)
+            if shift_pos >= 0:
+                shift_v = values[shift_pos]
             else:
-                out_rows.append(ft.DataRow(cells=cells, color=row_color))
-        return out_rows
+                shift_v = row_obj.get("shift", "") if isinstance(row_obj, dict) else ""
+            return values, shift_v
+
+        self._cells_builder = (fields, _read_row)
+        return _read_row
+
+    def _render_rows(self, widths: dict[str, int] | None = None) -> None:
+        """Render the first window of the filtered rows into the DataTable.
+
+        Only a window of rows is materialized; _on_table_scroll appends the
+        next chunk as the user nears the bottom of the table.
+        """
+        if self._dt is None:
+            return
+        self._rendered_count = min(
+            len(self._filtered_rows_data), self._row_window_size()
+        )
+        self._dt.rows = self._build_rows(
+            self._filtered_rows_data[: self._rendered_count],
+            widths,
+            recycle=self._dt.rows,
+        )
 
-    def _apply_filter(self, _e=None):
+    def _row_window_size(self) -> int:
+        """Rows to materialize per window: about two viewports' worth.
+
+        Rows are at least _row_min_height_px tall, so this never leaves the
+        visible area short of rows.
+        """
+        try:
+            h = float(getattr(self._content_container, "height", 0) or 0)
+        except Exception:
+            h = 0.0
+        if h <= 0:
+            return self._render_chunk_rows
+        per_view = int(h // max(1, self._row_min_height_px)) + 1
+        return max(20, per_view * 2)
+
+    def _fill_row_window(self) -> None:
+        """Append rows until the rendered window covers the current viewport.
+
+        A taller window (resize) needs more rows before a scroll can happen.
+        """
+        if self._dt is None:
+            return
+        want = min(len(self._filtered_rows_data), self._row_window_size())
+        start = int(self._rendered_count)
+        if want <= start:
+            return
+        self._dt.rows.extend(self._build_rows(self._filtered_rows_data[start:want]))
+        self._rendered_count = want
+
+    def _on_table_scroll(self, e=None):
+        try:
+            if self._dt is None:
+                return
+            pixels = float(getattr(e, "pixels", 0) or 0)
+            max_extent = float(getattr(e, "max_scroll_extent", 0) or 0)
+            viewport = float(getattr(e, "viewport_dimension", 0) or 0)
+
+            if self._trim_rows_below(pixels, viewport):
+                return
+
+            total = len(self._filtered_rows_data)
+            start = int(self._rendered_count)
+            if start >= total:
+                return
+            if pixels < max_extent - max(200.0, viewport):
+                return
+
+            end = min(total, start + self._row_window_size())
+            self._dt.rows.extend(
+                self._build_rows(self._filtered_rows_data[start:end])
+            )
+            self._rendered_count = end
+            self._dt.update()
+        except Exception:
+            pass
+
+    def _trim_rows_below(self, pixels: float, viewport: float) -> bool:
+        """Drop rendered rows far below the viewport after scrolling back up.
+
+        Rows are at least _row_min_height_px tall, so no row past index
+        (pixels + viewport) / min height can be on screen; one window of
+        rows is kept beyond that. Only rows below the viewport are removed,
+        so the scroll offset does not move; scrolling down appends them
+        again. Returns True when rows were removed.
+        """
+        if viewport <= 0:
+            return False
+        window = self._row_window_size()
+        last_visible = int((pixels + viewport) // max(1, self._row_min_height_px))
+        keep = last_visible + 1 + window
+        # Only trim once a full extra window has piled up, so scrolling back
+        # and forth near the edge does not drop and re-add the same rows.
+        if self._rendered_count <= keep + window:
+            return False
+        del self._dt.rows[keep:]
+        self._rendered_count = keep
+        self._dt.update()
+        return True
+
+    def _on_filter_change(self, _e=None):
+        self._apply_filter(live=True)
+
+    def _apply_filter(self, _e=None, *, force: bool = False, live: bool = False):
         page = self.page
         try:
+            # Live search needs run_task for its debounce; without it only
+            # Enter filters (a synchronous scan per keystroke would freeze).
+            if live and not callable(getattr(page, "run_task", None)):
+                return
+
             q = str(getattr(self._filter_tf, "value", "") or "").strip()
 
+            # Pressing Enter again on the query already shown (or still being
+            # computed) would only redo the same scan. `force` is for callers
+            # whose underlying rows changed.
+            if not force and q == self._applied_query:
+                return
+            self._applied_query = q
+
+            # Every call supersedes any pending/in-flight filter, including the
+            # empty-query restore below.
+            self._filter_seq += 1
+            seq = int(self._filter_seq)
+            self._cancel_filter_task()
+
             # Empty query: restore the initial tail view immediately.
             if not q:
-                self._rows_data = list(self._base_rows_data)
-                self._filtered_rows_data = list(self._base_rows_data)
+                self._rows_data = self._base_rows_data
+                same_rows = self._shows_same_rows(self._base_rows_data)
+                self._filtered_rows_data = self._base_rows_data
                 if self._title_text is not None:
                     self._title_text.value = f"{self.title} (showing {len(self._rows_data)} of {self._total_rows} rows)"
-                if self._dt is not None:
+                if self._dt is not None and not same_rows:
                     widths = self._get_column_widths_snapshot()
-                    self._dt.rows = self._build_rows(self._filtered_rows_data, widths)
-                    try:
-                        self._dt.update()
-                    except Exception:
-                        pass
+                    self._render_rows(widths)
+                if self._filter_tf is not None:
+                    self._filter_tf.disabled = False
+                if same_rows:
+                    self._push_updates(self._filter_tf, self._title_text)
+                else:
+                    self._push_updates(self._dt, self._filter_tf, self._title_text)
+                return
+
+            # When every source row is already loaded (and sorted), filter in
+            # memory instead of rescanning the CSV/DB.
+            in_memory = self._has_all_rows_loaded()
+
+            if not in_memory:
+                # Update title + disable input to signal work in progress
+                # (not while typing: live search keeps the field editable).
                 try:
-                    if self._filter_tf is not None:
-                        self._filter_tf.disabled = False
-                        self._filter_tf.update()
+                    if self._title_text is not None:
+                        self._title_text.value = f"{self.title} (filtering…)"
+                    if self._filter_tf is not None and not live:
+                        self._filter_tf.disabled = True
+                    if self._dlg is not None:
+                        self._dlg.update()
                 except Exception:
                     pass
-                return
 
-            # Non-empty query: run full-file filtering off the UI thread.
-            self._filter_seq += 1
-            seq = int(self._filter_seq)
+            fields_snapshot = list(self._fieldnames or [])
+            q_snapshot = str(q)
+
+            def _apply_result(matches_total: int | None, matches: list[dict]):
+                # Matches arrive in view order (sorted off the UI thread).
+                same_rows = self._shows_same_rows(matches)
+                self._filtered_rows_data = matches
 
-            # Update title + disable input to signal work in progress.
-            try:
                 if self._title_text is not None:
-                    self._title_text.value = f"{self.title} (filtering…)"
+                    if matches_total is None:
+                        self._title_text.value = f"{self.title} (showing {len(self._filtered_rows_data)} rows)"
+                    else:
+                        self._title_text.value = f"{self.title} (showing {len(self._filtered_rows_data)} of {matches_total} matches)"
+
                 if self._filter_tf is not None:
-                    self._filter_tf.disabled = True
-                if self._dlg is not None:
-                    self._dlg.update()
-            except Exception:
-                pass
+                    self._filter_tf.disabled = False
 
-            fields_snapshot = list(self._fieldnames or [])
-            q_snapshot = str(q)
+                if same_rows:
+                    # Same rows as on screen (e.g. a character typed and
+                    # erased): leave the table as it is.
+                    self._push_updates(self._filter_tf, self._title_text)
+                    return
+
+                if self._dt is not None:
+                    widths = self._get_column_widths_snapshot()
+                    self._render_rows(widths)
+
+                # Rows, title and input go out together in one update.
+                self._push_updates(self._dt, self._filter_tf, self._title_text)
+
+            delay = self._filter_live_debounce_s if live else self._filter_debounce_s
 
             async def _filter_async():
                 try:
-                    matches_total, matches_tail = await asyncio.to_thread(
-                        self._read_filtered_rows_for_fields, q_snapshot, fields_snapshot
-                    )
-
-                    # Ignore stale results.
+                    # Debounce: a newer submit inside the window supersedes
+                    # this one, so N rapid submits cause a single rebuild.
+                    await asyncio.sleep(delay)
                     if seq != self._filter_seq:
                         return
 
-                    if self._use_sqlite and self.db_path is not None:
-                        self._filtered_rows_data = list(matches_tail)
-                    else:
-                        self._filtered_rows_data = self._sort_rows(list(matches_tail))
-
-                    if self._title_text is not None:
-                        if matches_total is None:
-                            self._title_text.value = f"{self.title} (showing {len(self._filtered_rows_data)} rows)"
+                    def _submit(fn, *args) -> asyncio.Future:
+                        # A newer filter replaces one that has not started yet.
+                        prev = self._filter_future
+                        if prev is not None and not prev.done():
+                            prev.cancel()
+                        fut = self._run_in_worker(fn, *args)
+                        self._filter_future = fut
+                        return fut
+
+                    if in_memory:
+                        if len(self._base_rows_data) > self._filter_thread_min_rows:
+                            matches_tail = await _submit(
+                                self._filter_loaded_rows, q_snapshot
+                            )
                         else:
-                            self._title_text.value = f"{self.title} (showing {len(self._filtered_rows_data)} of {matches_total} matches)"
-
-                    if self._dt is not None:
-                        widths = self._get_column_widths_snapshot()
-                        self._dt.rows = self._build_rows(
-                            self._filtered_rows_data, widths
+                            matches_tail = self._filter_loaded_rows(q_snapshot)
+                        matches_total = len(matches_tail)
+                    else:
+                        matches_total, matches_tail = await _submit(
+                            self._filter_source_rows, q_snapshot, fields_snapshot
                         )
-                        try:
-                            self._dt.update()
-                        except Exception:
-                            pass
 
-                    try:
-                        if self._filter_tf is not None:
-                            self._filter_tf.disabled = False
-                            self._filter_tf.update()
-                    except Exception:
-                        pass
+                    # Let keystrokes queued while the scan ran reach
+                    # _apply_filter first: a newer query makes this result
+                    # stale, and its rows are then never built.
+                    await asyncio.sleep(0)
 
-                    try:
-                        if page is not None:
-                            page.update()
-                    except Exception:
-                        pass
+                    # Ignore stale results.
+                    if seq != self._filter_seq:
+                        return
+
+                    _apply_result(matches_total, matches_tail)
+                except asyncio.CancelledError:
+                    # Superseded by a newer filter before it started.
+                    return
                 except Exception as ex:
                     if seq != self._filter_seq:
                         return
+                    self._applied_query = None
                     try:
                         if self._title_text is not None:
                             self._title_text.value = f"{self.title} (filter failed)"
@@ -1506,40 +2418,24 @@ class HistoryTableDialog:
                 runner = getattr(page, "run_task", None)
                 if callable(runner):
                     # IMPORTANT: pass coroutine function (not coroutine object)
-                    runner(_filter_async)
+                    self._filter_task = runner(_filter_async)
                     return
             except Exception:
                 pass
 
             # Sync fallback
-            matches_total, matches_tail = self._read_filtered_rows(q_snapshot)
+            if in_memory:
+                matches_tail = self._filter_loaded_rows(q_snapshot)
+                matches_total = len(matches_tail)
+            else:
+                matches_total, matches_tail = self._filter_source_rows(
+                    q_snapshot, fields_snapshot
+                )
             if seq != self._filter_seq:
                 return
-            if self._use_sqlite and self.db_path is not None:
-                self._filtered_rows_data = list(matches_tail)
-            else:
-                self._filtered_rows_data = self._sort_rows(list(matches_tail))
-            if self._title_text is not None:
-                if matches_total is None:
-                    self._title_text.value = (
-                        f"{self.title} (showing {len(self._filtered_rows_data)} rows)"
-                    )
-                else:
-                    self._title_text.value = f"{self.title} (showing {len(self._filtered_rows_data)} of {matches_total} matches)"
-            if self._dt is not None:
-                widths = self._get_column_widths_snapshot()
-                self._dt.rows = self._build_rows(self._filtered_rows_data, widths)
-                try:
-                    self._dt.update()
-                except Exception:
-                    pass
-            try:
-                if self._filter_tf is not None:
-                    self._filter_tf.disabled = False
-                    self._filter_tf.update()
-            except Exception:
-                pass
+            _apply_result(matches_total, matches_tail)
         except Exception:
+            self._applied_query = None
             try:
                 if self._filter_tf is not None:
                     self._filter_tf.disabled = False
@@ -1547,6 +2443,48 @@ class HistoryTableDialog:
             except Exception:
                 pass
 
+    def _shows_same_rows(self, rows: list[dict]) -> bool:
+        """Return True when `rows` are the very row objects the table shows.
+
+        Filter results reuse the loaded row dicts, so an identical result set
+        is the same objects in the same order; the length check makes most
+        differing results cheap to reject.
+        """
+        shown = self._filtered_rows_data
+        if self._dt is None or not self._dt.rows:
+            return False
+        if shown is rows:
+            return True
+        return len(shown) == len(rows) and all(map(is_, shown, rows))
+
+    def _filter_source_rows(
+        self, q: str, fieldnames: list[str]
+    ) -> tuple[int | None, list[dict]]:
+        """Worker job: filter the CSV/DB and return matches in view order.
+
+        Everything except building the controls happens here: refining the
+        last full result, the CSV/DB scan, and (for CSV) the sort. The result
+        is remembered already sorted, so refined subsets stay sorted too.
+        """
+        refined = self._refine_last_matches(q, fieldnames)
+        if refined is not None:
+            return refined
+        matches_total, matches = self._read_filtered_rows_for_fields(q, fieldnames)
+        if not (self._use_sqlite and self.db_path is not None):
+            matches = self._sort_rows(matches)
+        self._remember_matches(q, fieldnames, matches_total, matches)
+        return matches_total, matches
+
+    def _cancel_filter_task(self) -> None:
+        """Cancel a superseded filter task that has not finished yet."""
+        task = self._filter_task
+        self._filter_task = None
+        try:
+            if task is not None and not task.done():
+                task.cancel()
+        except Exception:
+            pass
+
     def _get_column_width(self, col_name: str) -> int:
         name = str(col_name or "")
         if name in self._stretch_columns:
@@ -1557,8 +2495,20 @@ class HistoryTableDialog:
         if not self._fieldnames:
             return
 
-        stretch_cols = [c for c in self._fieldnames if c in self._stretch_columns]
-        if not stretch_cols:
+        # The stretch/fixed split only depends on the column set.
+        fields = tuple(self._fieldnames)
+        split = self._column_split_cache
+        if split is None or split[0] != fields:
+            n_stretch = sum(1 for c in fields if c in self._stretch_columns)
+            fixed_sum = sum(
+                int(self._fixed_col_widths.get(c, self._default_fixed_width_px))
+                for c in fields
+                if c not in self._stretch_columns
+            )
+            split = (fields, n_stretch, fixed_sum)
+            self._column_split_cache = split
+        _fields, n_stretch, fixed_sum = split
+        if not n_stretch:
             return
 
         dt_width = 900
@@ -1568,13 +2518,6 @@ class HistoryTableDialog:
         except Exception:
             dt_width = 900
 
-        fixed_cols = [c for c in self._fieldnames if c not in self._stretch_columns]
-        fixed_sum = 0
-        for c in fixed_cols:
-            fixed_sum += int(
-                self._fixed_col_widths.get(c, self._default_fixed_width_px)
-            )
-
         spacing = 0
         try:
             if self._dt is not None:
@@ -1584,51 +2527,71 @@ class HistoryTableDialog:
 
         total_spacing = max(0, (len(self._fieldnames) - 1) * spacing)
         remaining = dt_width - fixed_sum - total_spacing - int(self._width_padding_px)
-        per = int(remaining / max(1, len(stretch_cols)))
+        per = int(remaining / max(1, n_stretch))
         self._stretch_width_px = max(int(self._min_stretch_width_px), per)
 
-    def _apply_column_widths(self):
+    def _apply_column_widths(self, update: bool = True):
+        """Push the current column widths into the header and on-screen rows.
+
+        With `update=False` the caller sends the changes with its own
+        page.update().
+        """
         if self._dt is None:
             return
 
         self._recompute_stretch_width()
 
-        # Compute new widths and short-circuit if nothing changed.
+        # Compute new widths and short-circuit if nothing changed. Snapshots
+        # are memoized and read-only, so the same layout is the same object.
         widths = self._get_column_widths_snapshot()
-        if self._last_column_widths == widths:
+        last = self._last_column_widths
+        if last is widths or last == widths:
             return
-        self._last_column_widths = dict(widths)
-
+        self._last_column_widths = widths
+
+        col_widths = self._column_widths_list(widths)
+        # Cells need their own width (DataTable sizes a column to its widest
+        # cell), but only columns whose width moved have to be rewritten: on
+        # a resize that is just the stretch columns. Fixed columns keep the
+        # width every on-screen row was built or last resized with.
+        changed = [
+            (i, w)
+            for i, (name, w) in enumerate(zip(self._fieldnames, col_widths))
+            if last is None or last.get(name) != w
+        ]
         try:
-            for i, col_name in enumerate(self._fieldnames):
-                try:
-                    col_obj = self._dt.columns[i]
-                    label = getattr(col_obj, "label", None)
-                    if isinstance(label, ft.Container):
-                        label.width = int(
-                            widths.get(col_name, self._default_fixed_width_px)
-                        )
-                except Exception:
-                    pass
+            headers = self._header_containers
+            for i, w in changed:
+                if i < len(headers):
+                    headers[i].width = w
 
+            # Every row comes from _build_rows (one Container per cell), so
+            # the loop sets widths directly; one try around the whole pass.
             for row in self._dt.rows or []:
+                cells = row.cells
+                n_cells = len(cells)
+                for i, w in changed:
+                    if i < n_cells:
+                        cells[i].content.width = w
+
+            # Rows on screen were resized in place above: record that in
+            # their cache entries. Cached off-screen rows keep their old
+            # widths until _build_rows reuses them.
+            cache = self._row_control_cache
+            for row in self._dt.rows or []:
+                row_obj = row.data
+                entry = cache.get(id(row_obj))
+                if entry is not None and entry[1] is row:
+                    cache[id(row_obj)] = (row_obj, row, col_widths)
+
+            if update:
                 try:
-                    for i, col_name in enumerate(self._fieldnames):
-                        cell = row.cells[i]
-                        content = getattr(cell, "content", None)
-                        if isinstance(content, ft.Container):
-                            content.width = int(
-                                widths.get(col_name, self._default_fixed_width_px)
-                            )
+                    self._dt.update()
                 except Exception:
                     pass
-
-            try:
-                self._dt.update()
-            except Exception:
-                pass
         except Exception:
-            pass
+            # Not fully applied: let the next call redo every column.
+            self._last_column_widths = None
 
     def _get_page_window_size(self) -> tuple[int, int]:
         page = self.page
@@ -1656,13 +2619,30 @@ class HistoryTableDialog:
 
         return int(w or 1200), int(h or 900)
 
-    def _apply_responsive_size(self):
-        page = self.page
+    def _apply_responsive_size(
+        self, update: bool = True, size: tuple[int, int] | None = None
+    ):
+        """Fit the dialog to the current window size.
+
+        With `update=False` the caller sends the changes with its own
+        page.update(). `size` is a (width, height) the caller already read
+        with _get_page_window_size.
+        """
         if self._content_container is None:
             return
 
         try:
-            w, h = self._get_page_window_size()
+            w, h = size if size is not None else self._get_page_window_size()
+            last = self._last_responsive_size
+            if (
+                last is not None
+                and last[0] == w
+                and last[1] == h
+                and last[2] is self._content_container
+                and last[3] is self._dt
+            ):
+                return
+            self._last_responsive_size = (w, h, self._content_container, self._dt)
 
             # Clamp sizes to the current window so the dialog (and its action
             # buttons) never overflow off-screen.
@@ -1672,35 +2652,52 @@ class HistoryTableDialog:
             target_w = int(w * 0.92)
             target_h = int(h * 0.78)
 
-            self._content_container.width = min(max_w, max(320, target_w))
-            self._content_container.height = min(max_h, max(280, target_h))
+            cw = min(max_w, max(320, target_w))
+            ch = min(max_h, max(280, target_h))
+            dtw = max(240, int(cw * 0.98))
+
+            # The clamps above map many window sizes to the same layout (e.g.
+            # while dragging the window edge): nothing to send then.
+            container = self._content_container
+            if (
+                container.width == cw
+                and container.height == ch
+                and (self._dt is None or self._dt.width == dtw)
+            ):
+                return
+
+            container.width = cw
+            container.height = ch
 
             if self._dt is not None:
-                self._dt.width = max(240, int(self._content_container.width * 0.98))
-                self._apply_column_widths()
-                try:
-                    self._dt.update()
-                except Exception:
-                    pass
-            try:
-                self._content_container.update()
-            except Exception:
-                pass
+                self._dt.width = dtw
+                self._apply_column_widths(update=False)
+                self._fill_row_window()
 
-            # When the dialog is first opened, explicit updates help apply the
-            # size change before the user resizes the window.
-            try:
-                if self._dlg is not None:
-                    self._dlg.update()
-            except Exception:
-                pass
+            if update:
+                self._push_updates(self._dt, self._content_container, self._dlg)
+        except Exception:
+            pass
+
+    def _push_updates(self, *controls) -> None:
+        """Send pending changes to the client in one round-trip.
+
+        page.update() diffs the whole tree (dialog included) and sends one
+        message; updating `controls` one by one is only a fallback.
+        """
+        page = self.page
+        try:
+            if page is not None:
+                page.update()
+                return
+        except Exception:
+            pass
+        for ctrl in controls:
             try:
-                if page is not None:
-                    page.update()
+                if ctrl is not None:
+                    ctrl.update()
             except Exception:
                 pass
-        except Exception:
-            pass
 
     def _on_resize(self, evt=None):
         try:
@@ -1710,8 +2707,11 @@ class HistoryTableDialog:
             pass
 
         try:
-            if self._dlg is not None and getattr(self._dlg, "open", False):
-                self._apply_responsive_size()
-                self.page.update()
+            if self._dlg is None or not getattr(self._dlg, "open", False):
+                return
+            # Resize events arrive many times a second while dragging: the
+            # window size is read once per event and handed down, and a size
+            # already fitted returns early in _apply_responsive_size.
+            self._apply_responsive_size(size=self._get_page_window_size())
         except Exception:
             pass
@@ -2,6 +2,29 @@ import flet as ft
 
 from src.utils.theme import SWITCH_ACTIVE
 
+_HEADERS = ("Metric", "Target", "Actual")
+
+
+def _metric_row(metric: str, target: str, actual: str) -> ft.DataRow:
+    """Return one table row: metric label, then centered target and actual."""
+    return ft.DataRow(
+        cells=[
+            ft.DataCell(ft.Text(metric, size=11)),
+            ft.DataCell(
+                ft.Container(
+                    content=ft.Text(target, size=11),
+                    alignment=ft.alignment.center,
+                )
+            ),
+            ft.DataCell(
+                ft.Container(
+                    content=ft.Text(actual, size=11),
+                    alignment=ft.alignment.center,
+                )
+            ),
+        ]
+    )
+
 
 class MetricsTable(ft.Container):
     """Reusable metrics table component."""
@@ -30,38 +53,21 @@ class MetricsTable(ft.Container):
             "TRL",
         ]
 
-        default_rows = [
-            ft.DataRow(
-                cells=[
-                    ft.DataCell(ft.Text(metric, size=10)),
-                    ft.DataCell(
-                        ft.Container(
-                            alignment=ft.alignment.center,
-                        )
-                    ),
-                    ft.DataCell(
-                        ft.Container(
-                            alignment=ft.alignment.center,
-                        )
-                    ),
-                ]
-            )
-            for metric in default_metrics
-        ]
-
         table = ft.DataTable(
             columns=[
-                ft.DataColumn(ft.Text("Metric", size=12, weight=ft.FontWeight.W_600)),
                 ft.DataColumn(
-                    ft.Text("Target", size=12, weight=ft.FontWeight.W_600),
+                    ft.Text(_HEADERS[0], size=12, weight=ft.FontWeight.W_600)
+                ),
+                ft.DataColumn(
+                    ft.Text(_HEADERS[1], size=12, weight=ft.FontWeight.W_600),
                     heading_row_alignment=ft.MainAxisAlignment.CENTER,
                 ),
                 ft.DataColumn(
-                    ft.Text("Actual", size=12, weight=ft.FontWeight.W_600),
+                    ft.Text(_HEADERS[2], size=12, weight=ft.FontWeight.W_600),
                     heading_row_alignment=ft.MainAxisAlignment.CENTER,
                 ),
             ],
-            rows=default_rows,
+            rows=[],
             border=ft.border.all(1, ft.Colors.BLACK12),
             heading_row_color=ft.Colors.BLUE_GREY_50,
             data_row_max_height=24,
@@ -91,6 +97,11 @@ class MetricsTable(ft.Container):
         )
 
         self._table = table
+        # Text of the rows as last set (metric, target, actual), so reading the
+        # table back does not walk the Flet controls. Only _apply_rows sets it.
+        self._rows_snapshot: list[tuple[str, str, str]] = []
+        # Placeholder rows go through the same path as later data.
+        self._apply_rows([(metric, "", "") for metric in default_metrics])
 
         super().__init__(
             content=content,
@@ -107,86 +118,28 @@ class MetricsTable(ft.Container):
 
         rows: list of tuples where each tuple is (metric, target, actual)
         """
-        dt_rows = []
-        for metric, target, actual in rows:
-            dt_rows.append(
-                ft.DataRow(
-                    cells=[
-                        ft.DataCell(ft.Text(metric, size=11)),
-                        ft.DataCell(
-                            ft.Container(
-                                content=ft.Text(str(target), size=11),
-                                alignment=ft.alignment.center,
-                            )
-                        ),
-                        ft.DataCell(
-                            ft.Container(
-                                content=ft.Text(str(actual), size=11),
-                                alignment=ft.alignment.center,
-                            )
-                        ),
-                    ]
-                )
-            )
-        # replace the DataTable rows
-        try:
-            self._table.rows = dt_rows
-        except Exception:
-            # fallback
-            self.content.controls[1].rows = dt_rows
+        self._apply_rows(rows)
         self.update()
 
-    def _extract_cell_text(self, cell: ft.DataCell) -> str:
-        try:
-            c = getattr(cell, "content", None)
-            if isinstance(c, ft.Text):
-                return str(c.value or "").strip()
-            if isinstance(c, ft.Container):
-                inner = getattr(c, "content", None)
-                if isinstance(inner, ft.Text):
-                    return str(inner.value or "").strip()
-                return str(inner).strip() if inner is not None else ""
-            return str(c).strip() if c is not None else ""
-        except Exception:
-            return ""
+    def _apply_rows(self, rows: list[tuple[str, str, str]]) -> None:
+        """Build the DataTable rows and the text snapshot (no update)."""
+        dt_rows = [
+            _metric_row(metric, str(target), str(actual))
+            for metric, target, actual in rows
+        ]
+        self._table.rows = dt_rows
+        self._rows_snapshot = [
+            (str(metric).strip(), str(target).strip(), str(actual).strip())
+            for metric, target, actual in rows
+        ]
 
     def get_tabulate_data(self) -> tuple[list[str], list[list[str]]]:
         """Return (headers, rows) for printing via tabulate."""
-        headers: list[str] = []
-        rows: list[list[str]] = []
-        try:
-            table = getattr(self, "_table", None) or self.content.controls[1]
-
-            for col in list(getattr(table, "columns", None) or []):
-                label = getattr(col, "label", None)
-                if isinstance(label, ft.Text):
-                    headers.append(str(label.value or "").strip())
-                else:
-                    headers.append(str(label).strip() if label is not None else "")
-
-            for r in list(getattr(table, "rows", None) or []):
-                row_cells = []
-                for cell in list(getattr(r, "cells", None) or []):
-                    row_cells.append(self._extract_cell_text(cell))
-                if row_cells:
-                    rows.append(row_cells)
-        except Exception:
-            pass
-        return headers, rows
+        return list(_HEADERS), [list(r) for r in self._rows_snapshot]
 
     def get_rows_data(self) -> list[tuple[str, str, str]]:
         """Return the current table as list of (metric, target, actual)."""
-        try:
-            _headers, rows = self.get_tabulate_data()
-            out: list[tuple[str, str, str]] = []
-            for r in rows:
-                metric = str(r[0]) if len(r) > 0 else ""
-                target = str(r[1]) if len(r) > 1 else ""
-                actual = str(r[2]) if len(r) > 2 else ""
-                out.append((metric, target, actual))
-            return out
-        except Exception:
-            return []
+        return list(self._rows_snapshot)
 
     def set_targets(self, targets: dict[str, str]):
         """Update Target column values by metric name, preserving Actual."""
@@ -1,62 +1,57 @@
 from __future__ import annotations
 
 import asyncio
-import base64
-import hashlib
-import io
 import threading
-from collections import OrderedDict
+from collections.abc import Callable
+from functools import lru_cache
 
 import flet as ft
 
 from src.services.config_service import get_ui_config
+from src.utils.qr_image import build_qr_b64
 from src.utils.theme import DANGER, ON_COLOR
 from src.utils.ui_helpers import open_dialog
 
-_QR_CACHE_LOCK = threading.Lock()
-_QR_CACHE: "OrderedDict[str, str]" = OrderedDict()
-_QR_CACHE_MAX: int | None = None
+# build_qr_b64 behind functools.lru_cache (C-level LRU keyed on the payload),
+# created on first use so the size comes from config.ini.
+_QR_BUILDER: Callable[[str], str] | None = None
+_QR_BUILDER_LOCK = threading.Lock()
+# (payload, image) of the last QR shown: reopening the same report shows it
+# in the first frame, without the spinner or a worker-thread round-trip.
+_QR_LAST: tuple[str, str] | None = None
 
 
 def _get_qr_cache_max() -> int:
-    global _QR_CACHE_MAX
-    if _QR_CACHE_MAX is not None:
-        return _QR_CACHE_MAX
     try:
         ui_cfg, _err = get_ui_config()
-        _QR_CACHE_MAX = int(getattr(ui_cfg, "qr_cache_size", 20) or 0)
+        max_size = int(getattr(ui_cfg, "qr_cache_size", 20) or 0)
     except Exception:
-        _QR_CACHE_MAX = 20
-    if _QR_CACHE_MAX < 0:
-        _QR_CACHE_MAX = 0
-    return _QR_CACHE_MAX
+        max_size = 20
+    return max(0, max_size)
 
 
-def _qr_cache_key(payload: str) -> str:
-    p = payload or ""
-    h = hashlib.sha256(p.encode("utf-8", errors="ignore")).hexdigest()
-    return f"sha256:{h}:len:{len(p)}"
+def _get_qr_builder() -> Callable[[str], str]:
+    global _QR_BUILDER
+    with _QR_BUILDER_LOCK:
+        if _QR_BUILDER is None:
+            max_size = _get_qr_cache_max()
+            if max_size > 0:
+                _QR_BUILDER = lru_cache(maxsize=max_size)(build_qr_b64)
+            else:
+                _QR_BUILDER = build_qr_b64
+        return _QR_BUILDER
 
 
-def _qr_cache_get(key: str) -> str | None:
-    with _QR_CACHE_LOCK:
-        v = _QR_CACHE.get(key)
-        if v is None:
-            return None
-        # Mark as recently used
-        _QR_CACHE.move_to_end(key)
-        return v
+def _build_qr_cached(payload: str) -> str:
+    """Return the QR image for `payload`, from the LRU cache when possible.
 
-
-def _qr_cache_put(key: str, png_b64: str) -> None:
-    max_size = _get_qr_cache_max()
-    if max_size <= 0:
-        return
-    with _QR_CACHE_LOCK:
-        _QR_CACHE[key] = png_b64
-        _QR_CACHE.move_to_end(key)
-        while len(_QR_CACHE) > max_size:
-            _QR_CACHE.popitem(last=False)
+    Runs in a worker thread: the first call also reads the cache size from
+    config.ini, which then stays off the UI thread as well.
+    """
+    global _QR_LAST
+    img_b64 = _get_qr_builder()(payload)
+    _QR_LAST = (payload, img_b64)
+    return img_b64
 
 
 class QrCodeDialog:
@@ -80,15 +75,23 @@ class QrCodeDialog:
         if page is None:
             return
 
+        payload = self.payload or ""
+        last = _QR_LAST
+        cached = last[1] if last is not None and last[0] == payload else None
+
         # Open a lightweight dialog immediately (prevents perceived "no response").
         img = ft.Image(
-            src_base64=None,
+            src_base64=cached,
             width=self.width,
             height=self.height,
-            visible=False,
+            # One pixel per module: scale up to the box without smoothing, so
+            # module edges stay crisp.
+            fit=ft.ImageFit.CONTAIN,
+            filter_quality=ft.FilterQuality.NONE,
+            visible=cached is not None,
         )
-        progress = ft.ProgressRing(visible=True)
-        status = ft.Text("Generating QR…", size=12)
+        progress = ft.ProgressRing(visible=cached is None)
+        status = ft.Text("" if cached else "Generating QR…", size=12)
 
         loading_overlay = ft.Container(
             content=ft.Column(
@@ -100,7 +103,7 @@ class QrCodeDialog:
             ),
             alignment=ft.alignment.center,
             expand=True,
-            visible=True,
+            visible=cached is None,
         )
 
         dlg: ft.AlertDialog | None = None
@@ -148,66 +151,38 @@ class QrCodeDialog:
         )
 
         open_dialog(page, dlg)
+        if cached is not None:
+            return
 
-        # Fast path: if we've generated this payload before, show immediately.
-        key = _qr_cache_key(self.payload or "")
-        cached = _qr_cache_get(key)
-        if cached:
+        def _show_image(img_b64: str) -> None:
             try:
                 progress.visible = False
                 status.value = ""
                 loading_overlay.visible = False
-                img.src_base64 = cached
+                img.src_base64 = img_b64
                 img.visible = True
                 page.update()
             except Exception:
                 pass
-            return
 
-        async def _generate_qr_async():
+        def _show_error(ex: Exception) -> None:
             try:
-                # Import here so the rest of the app still works even if qrcode isn't installed.
-                import qrcode
-
-                def _build_png_b64(payload: str) -> str:
-                    qr = qrcode.QRCode(
-                        error_correction=qrcode.constants.ERROR_CORRECT_M,
-                        box_size=8,
-                        border=2,
-                    )
-                    qr.add_data(payload or "")
-                    qr.make(fit=True)
-                    img_pil = qr.make_image(fill_color="black", back_color="white")
-
-                    buf = io.BytesIO()
-                    img_pil.save(buf, format="PNG")
-                    return base64.b64encode(buf.getvalue()).decode("ascii")
-
-                png_b64 = await asyncio.to_thread(_build_png_b64, self.payload or "")
-
-                try:
-                    _qr_cache_put(key, png_b64)
-                except Exception:
-                    pass
+                progress.visible = False
+                status.value = f"Failed to generate QR: {ex}"
+                loading_overlay.visible = True
+                page.update()
+            except Exception:
+                pass
 
-                # Update UI
-                try:
-                    progress.visible = False
-                    status.value = ""
-                    loading_overlay.visible = False
-                    img.src_base64 = png_b64
-                    img.visible = True
-                    page.update()
-                except Exception:
-                    pass
+        # The click handler returns once the dialog is open; the QR is built
+        # (or taken from the LRU cache) in a worker thread.
+        async def _generate_qr_async():
+            try:
+                img_b64 = await asyncio.to_thread(_build_qr_cached, payload)
             except Exception as ex:
-                try:
-                    progress.visible = False
-                    status.value = f"Failed to generate QR: {ex}"
-                    loading_overlay.visible = True
-                    page.update()
-                except Exception:
-                    pass
+                _show_error(ex)
+                return
+            _show_image(img_b64)
 
         # Run in background if available; otherwise do best-effort sync (may block).
         try:
@@ -221,37 +196,8 @@ class QrCodeDialog:
 
         # Fallback: run synchronously (older runtimes)
         try:
-            import qrcode
-
-            qr = qrcode.QRCode(
-                error_correction=qrcode.constants.ERROR_CORRECT_M,
-                box_size=8,
-                border=2,
-            )
-            qr.add_data(self.payload or "")
-            qr.make(fit=True)
-            img_pil = qr.make_image(fill_color="black", back_color="white")
-
-            buf = io.BytesIO()
-            img_pil.save(buf, format="PNG")
-            png_b64 = base64.b64encode(buf.getvalue()).decode("ascii")
-
-            try:
-                _qr_cache_put(key, png_b64)
-            except Exception:
-                pass
-
-            progress.visible = False
-            status.value = ""
-            loading_overlay.visible = False
-            img.src_base64 = png_b64
-            img.visible = True
-            page.update()
+            img_b64 = _build_qr_cached(payload)
         except Exception as ex:
-            try:
-                progress.visible = False
-                status.value = f"Failed to generate QR: {ex}"
-                loading_overlay.visible = True
-                page.update()
-            except Exception:
-                pass
+            _show_error(ex)
+            return
+        _show_image(img_b64)
@@ -16,6 +16,22 @@ from src.utils.helpers import data_app_path, load_settings_options
 from src.utils.theme import DANGER, INFO, ON_COLOR, PRIMARY, SUCCESS, WARNING
 from src.utils.ui_helpers import open_dialog, resolve_page, snack
 
+# Header icon buttons as (ft.Icons name, bgcolor, tooltip, handler method), one
+# tuple per header Row: report actions on the left, card actions on the right.
+_HEADER_BUTTONS = (
+    (
+        ("QR_CODE", WARNING, "Show QR code", "_on_show_qr_code"),
+        ("EDIT", PRIMARY, "Edit target", "_on_show_target_editor"),
+        ("SAVE", SUCCESS, "Save report", "_on_save_report"),
+        ("TABLE_ROWS", INFO, "Show history", "_on_show_history_table"),
+    ),
+    (
+        ("ADD_ROUNDED", SUCCESS, "Add card", "_on_add_card"),
+        ("RESTORE", INFO, "Restore last cleared", "_on_restore_last"),
+        ("CLEAR", DANGER, "Clear all", "_on_clear_all"),
+    ),
+)
+
 
 class ReportEditor(ft.Container):
     def __init__(
@@ -42,6 +58,39 @@ class ReportEditor(ft.Container):
         self._get_func_location_cb = get_func_location
         self._get_date_field_cb = get_date_field
         self._on_history_saved_cb = on_history_saved
+        self._history_dialog = None
+        # Confirm dialogs are built once per page and reopened; only their
+        # changing parts (user list, card count) are updated per open.
+        self._restore_dialog: ft.AlertDialog | None = None
+        self._clear_dialog: ft.AlertDialog | None = None
+        self._save_dialog: ft.AlertDialog | None = None
+        self._save_user_dd: ft.Dropdown | None = None
+        self._save_count_text: ft.Text | None = None
+        # (user.txt mtime_ns, options) so save clicks skip re-reading the file
+        # while it is unchanged; the list shown in the save dropdown is kept to
+        # reuse its Option controls for as long as the options stay the same.
+        self._user_options_cache: tuple[int, list[str]] | None = None
+        self._save_user_options: list[str] | None = None
+
+        # Header icon buttons: one Row per spec group in _HEADER_BUTTONS.
+        button_rows = [
+            [
+                ft.IconButton(
+                    icon=getattr(ft.Icons, name),
+                    icon_color=ON_COLOR,
+                    bgcolor=bgcolor,
+                    icon_size=18,
+                    tooltip=tooltip,
+                    on_click=getattr(self, handler),
+                )
+                for name, bgcolor, tooltip, handler in group
+            ]
+            for group in _HEADER_BUTTONS
+        ]
+        # Keep a handle to the Restore button; it stays disabled until a clear
+        # leaves something to restore.
+        self._restore_btn = button_rows[1][1]
+        self._restore_btn.disabled = True
 
         header = ft.Container(
             bgcolor=ft.Colors.WHITE,
@@ -51,73 +100,7 @@ class ReportEditor(ft.Container):
             border_radius=10,
             content=ft.Row(
                 controls=[
-                    ft.Row(
-                        controls=[
-                            ft.IconButton(
-                                icon=ft.Icons.QR_CODE,
-                                icon_color=ON_COLOR,
-                                bgcolor=WARNING,
-                                icon_size=18,
-                                tooltip="Show QR code",
-                                on_click=self._on_show_qr_code,
-                            ),
-                            ft.IconButton(
-                                icon=ft.Icons.EDIT,
-                                icon_color=ON_COLOR,
-                                bgcolor=PRIMARY,
-                                icon_size=18,
-                                tooltip="Edit target",
-                                on_click=self._on_show_target_editor,
-                            ),
-                            ft.IconButton(
-                                icon=ft.Icons.SAVE,
-                                icon_color=ON_COLOR,
-                                bgcolor=SUCCESS,
-                                icon_size=18,
-                                tooltip="Save report",
-                                on_click=self._on_save_report,
-                            ),
-                            ft.IconButton(
-                                icon=ft.Icons.TABLE_ROWS,
-                                icon_color=ON_COLOR,
-                                bgcolor=INFO,
-                                icon_size=18,
-                                tooltip="Show history",
-                                on_click=self._on_show_history_table,
-                            ),
-                        ],
-                        spacing=8,
-                    ),
-                    ft.Row(
-                        controls=[
-                            ft.IconButton(
-                                icon=ft.Icons.ADD_ROUNDED,
-                                icon_color=ON_COLOR,
-                                bgcolor=SUCCESS,
-                                icon_size=18,
-                                tooltip="Add card",
-                                on_click=self._on_add_card,
-                            ),
-                            ft.IconButton(
-                                icon=ft.Icons.RESTORE,
-                                icon_color=ON_COLOR,
-                                bgcolor=INFO,
-                                icon_size=18,
-                                tooltip="Restore last cleared",
-                                on_click=self._on_restore_last,
-                                disabled=True,
-                            ),
-                            ft.IconButton(
-                                icon=ft.Icons.CLEAR,
-                                icon_color=ON_COLOR,
-                                bgcolor=DANGER,
-                                icon_size=18,
-                                tooltip="Clear all",
-                                on_click=self._on_clear_all,
-                            ),
-                        ],
-                        spacing=8,
-                    ),
+                    ft.Row(controls=buttons, spacing=8) for buttons in button_rows
                 ],
                 expand=True,
                 spacing=10,
@@ -160,12 +143,6 @@ class ReportEditor(ft.Container):
         except Exception:
             pass
 
-        # Keep a handle to the Restore button (header -> Row[1] -> controls[1])
-        try:
-            self._restore_btn = header.content.controls[1].controls[1]
-        except Exception:
-            self._restore_btn = None
-
         super().__init__(
             content=ft.Column(
                 controls=[
@@ -665,8 +642,6 @@ class ReportEditor(ft.Container):
             self._sync_restore_enabled(page)
             return
 
-        cards = list(getattr(self.report_list, "controls", None) or [])
-
         def _do_restore():
             ok = self.report_list.restore_last(replace_current=True)
             self._sync_restore_enabled(page)
@@ -680,56 +655,59 @@ class ReportEditor(ft.Container):
                 kind="success" if ok else "error",
             )
 
-        if cards:
-
-            def _close_dialog(_e=None):
-                try:
-                    dlg.open = False
-                    page.update()
-                except Exception:
-                    pass
+        if getattr(self.report_list, "controls", None):
+            dlg = self._restore_dialog
+            if dlg is None or dlg.page is not page:
 
-            def _confirm(_e=None):
-                try:
-                    _do_restore()
-                finally:
-                    _close_dialog()
+                def _close_dialog(_e=None):
+                    try:
+                        dlg.open = False
+                        page.update()
+                    except Exception:
+                        pass
 
-            dlg = ft.AlertDialog(
-                modal=True,
-                title=ft.Text("Confirm"),
-                content=ft.Container(
-                    content=ft.Text(
-                        "Replace current cards with the last cleared list?"
+                def _confirm(_e=None):
+                    try:
+                        _do_restore()
+                    finally:
+                        _close_dialog()
+
+                dlg = ft.AlertDialog(
+                    modal=True,
+                    title=ft.Text("Confirm"),
+                    content=ft.Container(
+                        content=ft.Text(
+                            "Replace current cards with the last cleared list?"
+                        ),
+                        padding=ft.padding.all(12),
+                        bgcolor=ft.Colors.WHITE,
+                        border=ft.border.all(1, ft.Colors.BLACK12),
+                        border_radius=10,
                     ),
-                    padding=ft.padding.all(12),
-                    bgcolor=ft.Colors.WHITE,
-                    border=ft.border.all(1, ft.Colors.BLACK12),
-                    border_radius=10,
-                ),
-                actions=[
-                    ft.Row(
-                        controls=[
-                            ft.ElevatedButton(
-                                "Cancel",
-                                on_click=_close_dialog,
-                                color=ON_COLOR,
-                                bgcolor=DANGER,
-                            ),
-                            ft.ElevatedButton(
-                                "Restore",
-                                on_click=_confirm,
-                                color=ON_COLOR,
-                                bgcolor=INFO,
-                            ),
-                        ],
-                        alignment=ft.MainAxisAlignment.END,
-                        spacing=8,
-                    )
-                ],
-                actions_alignment=ft.MainAxisAlignment.END,
-                on_dismiss=lambda _e: _close_dialog(),
-            )
+                    actions=[
+                        ft.Row(
+                            controls=[
+                                ft.ElevatedButton(
+                                    "Cancel",
+                                    on_click=_close_dialog,
+                                    color=ON_COLOR,
+                                    bgcolor=DANGER,
+                                ),
+                                ft.ElevatedButton(
+                                    "Restore",
+                                    on_click=_confirm,
+                                    color=ON_COLOR,
+                                    bgcolor=INFO,
+                                ),
+                            ],
+                            alignment=ft.MainAxisAlignment.END,
+                            spacing=8,
+                        )
+                    ],
+                    actions_alignment=ft.MainAxisAlignment.END,
+                    on_dismiss=lambda _e: _close_dialog(),
+                )
+                self._restore_dialog = dlg
             open_dialog(page, dlg)
             return
 
@@ -740,115 +718,157 @@ class ReportEditor(ft.Container):
         if page is None:
             return
 
-        csv_path = data_app_path("history.csv", folder_name="data_app/history")
-        db_path = data_app_path("history.db", folder_name="data_app/history")
-        HistoryTableDialog(
-            page=page,
-            csv_path=csv_path,
-            db_path=db_path,
-            hidden_columns={
-                "save_id",
-                "saved_at",
-                "card_index",
-                "detail_index",
-                "action_index",
-            },
-        ).show()
+        # Reuse the dialog so reopening keeps its table tree and caches.
+        dlg = self._history_dialog
+        if dlg is None or dlg.page is not page:
+            csv_path = data_app_path("history.csv", folder_name="data_app/history")
+            db_path = data_app_path("history.db", folder_name="data_app/history")
+            dlg = HistoryTableDialog(
+                page=page,
+                csv_path=csv_path,
+                db_path=db_path,
+                hidden_columns={
+                    "save_id",
+                    "saved_at",
+                    "card_index",
+                    "detail_index",
+                    "action_index",
+                },
+            )
+            self._history_dialog = dlg
+        dlg.show()
 
     def _on_save_report(self, e):
         page = resolve_page(e, fallback=getattr(self, "page", None))
         if page is None:
             return
 
-        cards = list(getattr(self.report_list, "controls", None) or [])
-        if not cards:
+        # The live controls list: the snapshot copy is taken by the save
+        # itself (in the worker), not on every click.
+        controls = getattr(self.report_list, "controls", None) or []
+        if not controls:
             snack(page, "No cards to save", kind="warning")
             return
 
-        # Load user options (from data_app/settings/user.txt)
-        try:
-            _p, user_options, _created, _err = load_settings_options(
-                filename="user.txt",
-                defaults=["Alice", "Bob", "Charlie"],
-            )
-        except Exception:
-            user_options = ["Alice", "Bob", "Charlie"]
+        user_options = self._get_user_options()
 
-        if not user_options:
-            user_options = ["Alice", "Bob", "Charlie"]
+        dlg = self._save_dialog
+        if dlg is None or dlg.page is not page:
+            user_dd = ft.Dropdown(
+                options=[],
+                label="User",
+                hint_text="Choose your name",
+                text_size=12,
+                expand=True,
+                content_padding=10,
+                value=None,
+            )
 
-        user_dd = ft.Dropdown(
-            options=[ft.dropdown.Option(opt) for opt in user_options],
-            label="User",
-            hint_text="Choose your name",
-            text_size=12,
-            expand=True,
-            content_padding=10,
-            value=None,
-        )
+            count_text = ft.Text("")
 
-        def _do_save(selected_user: str):
-            try:
-                # Sidebar metadata (best-effort)
-                shift = "Shift 1"
+            def _do_save(selected_user: str):
                 try:
-                    if callable(getattr(self, "_get_selected_shift_cb", None)):
-                        shift = (
-                            str(self._get_selected_shift_cb() or "Shift 1").strip()
-                            or "Shift 1"
-                        )
-                except Exception:
+                    # Sidebar metadata (best-effort)
                     shift = "Shift 1"
+                    try:
+                        if callable(getattr(self, "_get_selected_shift_cb", None)):
+                            shift = (
+                                str(self._get_selected_shift_cb() or "Shift 1").strip()
+                                or "Shift 1"
+                            )
+                    except Exception:
+                        shift = "Shift 1"
 
-                link_up = "LU22"
-                try:
-                    if callable(getattr(self, "_get_link_up_cb", None)):
-                        link_up = (
-                            str(self._get_link_up_cb() or "LU22").strip() or "LU22"
-                        )
-                except Exception:
                     link_up = "LU22"
+                    try:
+                        if callable(getattr(self, "_get_link_up_cb", None)):
+                            link_up = (
+                                str(self._get_link_up_cb() or "LU22").strip() or "LU22"
+                            )
+                    except Exception:
+                        link_up = "LU22"
 
-                func_location = "Packer"
-                try:
-                    if callable(getattr(self, "_get_func_location_cb", None)):
-                        func_location = (
-                            str(self._get_func_location_cb() or "Packer").strip()
-                            or "Packer"
-                        )
-                except Exception:
                     func_location = "Packer"
+                    try:
+                        if callable(getattr(self, "_get_func_location_cb", None)):
+                            func_location = (
+                                str(self._get_func_location_cb() or "Packer").strip()
+                                or "Packer"
+                            )
+                    except Exception:
+                        func_location = "Packer"
 
-                date_field = ""
-                try:
-                    if callable(getattr(self, "_get_date_field_cb", None)):
-                        date_field = str(self._get_date_field_cb() or "").strip()
-                except Exception:
                     date_field = ""
+                    try:
+                        if callable(getattr(self, "_get_date_field_cb", None)):
+                            date_field = str(self._get_date_field_cb() or "").strip()
+                    except Exception:
+                        date_field = ""
 
-                user = str(selected_user or "").strip()
+                    user = str(selected_user or "").strip()
+                    # Read at save time: the dialog (and this closure) is reused.
+                    controls = getattr(self.report_list, "controls", None) or []
 
-                db_path = data_app_path("history.db", folder_name="data_app/history")
+                    db_path = data_app_path(
+                        "history.db", folder_name="data_app/history"
+                    )
 
-                snack(page, "Saving…", kind="warning")
+                    snack(page, "Saving…", kind="warning")
 
-                async def _run_save():
-                    try:
+                    async def _run_save():
+                        try:
 
-                        def _worker():
-                            return save_report_history_sqlite(
-                                db_path=db_path,
-                                cards=cards,
-                                extract_issue=self.report_list._extract_issue_text,
-                                extract_details=self.report_list._extract_details,
-                                shift=shift,
-                                link_up=link_up,
-                                func_location=func_location,
-                                date_field=date_field,
-                                user=user,
-                            )
+                            def _worker():
+                                return save_report_history_sqlite(
+                                    db_path=db_path,
+                                    cards=list(controls),
+                                    extract_issue=self.report_list._extract_issue_text,
+                                    extract_details=self.report_list._extract_details,
+                                    shift=shift,
+                                    link_up=link_up,
+                                    func_location=func_location,
+                                    date_field=date_field,
+                                    user=user,
+                                )
+
+                            ok, msg = await asyncio.to_thread(_worker)
+                            msg_l = str(msg or "").lower()
+                            if ok:
+                                kind = "success"
+                            elif any(
+                                k in msg_l for k in ("terbuka", "terkunci", "locked")
+                            ):
+                                kind = "warning"
+                            else:
+                                kind = "error"
+                            snack(page, msg, kind=kind)
+                            if ok:
+                                try:
+                                    self.report_list.discard_last_snapshot()
+                                    self._sync_restore_enabled(page)
+                                    self._clear_draft_storage()
+                                except Exception:
+                                    pass
+                                self._notify_history_saved(page)
+                        except Exception as ex:
+                            snack(page, f"Failed to save report: {ex}", kind="error")
 
-                        ok, msg = await asyncio.to_thread(_worker)
+                    runner = getattr(page, "run_task", None)
+                    if callable(runner):
+                        runner(_run_save)
+                    else:
+                        # Fallback (blocking) if run_task isn't available
+                        ok, msg = save_report_history_sqlite(
+                            db_path=db_path,
+                            cards=list(controls),
+                            extract_issue=self.report_list._extract_issue_text,
+                            extract_details=self.report_list._extract_details,
+                            shift=shift,
+                            link_up=link_up,
+                            func_location=func_location,
+                            date_field=date_field,
+                            user=user,
+                        )
                         msg_l = str(msg or "").lower()
                         if ok:
                             kind = "success"
@@ -865,106 +885,120 @@ class ReportEditor(ft.Container):
                             except Exception:
                                 pass
                             self._notify_history_saved(page)
-                    except Exception as ex:
-                        snack(page, f"Failed to save report: {ex}", kind="error")
-
-                runner = getattr(page, "run_task", None)
-                if callable(runner):
-                    runner(_run_save)
-                else:
-                    # Fallback (blocking) if run_task isn't available
-                    ok, msg = save_report_history_sqlite(
-                        db_path=db_path,
-                        cards=cards,
-                        extract_issue=self.report_list._extract_issue_text,
-                        extract_details=self.report_list._extract_details,
-                        shift=shift,
-                        link_up=link_up,
-                        func_location=func_location,
-                        date_field=date_field,
-                        user=user,
-                    )
-                    msg_l = str(msg or "").lower()
-                    if ok:
-                        kind = "success"
-                    elif any(k in msg_l for k in ("terbuka", "terkunci", "locked")):
-                        kind = "warning"
-                    else:
-                        kind = "error"
-                    snack(page, msg, kind=kind)
-                    if ok:
-                        try:
-                            self.report_list.discard_last_snapshot()
-                            self._sync_restore_enabled(page)
-                            self._clear_draft_storage()
-                        except Exception:
-                            pass
-                        self._notify_history_saved(page)
-            except Exception as ex:
-                snack(page, f"Failed to save report: {ex}", kind="error")
+                except Exception as ex:
+                    snack(page, f"Failed to save report: {ex}", kind="error")
 
-        def _close_dialog(_e=None):
-            try:
-                dlg.open = False
-                page.update()
-            except Exception:
-                pass
+            def _close_dialog(_e=None):
+                try:
+                    dlg.open = False
+                    page.update()
+                except Exception:
+                    pass
 
-        def _confirm(_e=None):
-            selected_user = str(getattr(user_dd, "value", "") or "").strip()
-            if not selected_user:
-                snack(page, "Please select a user before saving.", kind="warning")
-                return
-            try:
-                _close_dialog()
-            finally:
-                _do_save(selected_user)
-
-        dlg = ft.AlertDialog(
-            modal=True,
-            title=ft.Text("Confirm"),
-            content=ft.Container(
-                content=ft.Column(
-                    controls=[
-                        ft.Text("Select user:"),
-                        user_dd,
-                        ft.Divider(height=10),
-                        ft.Text(f"Save report to history? ({len(cards)} card)"),
-                    ],
-                    spacing=10,
+            def _confirm(_e=None):
+                selected_user = str(getattr(user_dd, "value", "") or "").strip()
+                if not selected_user:
+                    snack(page, "Please select a user before saving.", kind="warning")
+                    return
+                try:
+                    _close_dialog()
+                finally:
+                    _do_save(selected_user)
+
+            dlg = ft.AlertDialog(
+                modal=True,
+                title=ft.Text("Confirm"),
+                content=ft.Container(
+                    content=ft.Column(
+                        controls=[
+                            ft.Text("Select user:"),
+                            user_dd,
+                            ft.Divider(height=10),
+                            count_text,
+                        ],
+                        spacing=10,
+                    ),
+                    padding=ft.padding.all(12),
+                    bgcolor=ft.Colors.WHITE,
+                    border=ft.border.all(1, ft.Colors.BLACK12),
+                    border_radius=10,
+                    height=150,
                 ),
-                padding=ft.padding.all(12),
-                bgcolor=ft.Colors.WHITE,
-                border=ft.border.all(1, ft.Colors.BLACK12),
-                border_radius=10,
-                height=150,
-            ),
-            actions=[
-                ft.Row(
-                    controls=[
-                        ft.ElevatedButton(
-                            "Cancel",
-                            on_click=_close_dialog,
-                            color=ON_COLOR,
-                            bgcolor=DANGER,
-                        ),
-                        ft.ElevatedButton(
-                            "Save",
-                            on_click=_confirm,
-                            color=ON_COLOR,
-                            bgcolor=SUCCESS,
-                        ),
-                    ],
-                    alignment=ft.MainAxisAlignment.END,
-                    spacing=8,
-                )
-            ],
-            actions_alignment=ft.MainAxisAlignment.END,
-            on_dismiss=lambda _e: _close_dialog(),
-        )
+                actions=[
+                    ft.Row(
+                        controls=[
+                            ft.ElevatedButton(
+                                "Cancel",
+                                on_click=_close_dialog,
+                                color=ON_COLOR,
+                                bgcolor=DANGER,
+                            ),
+                            ft.ElevatedButton(
+                                "Save",
+                                on_click=_confirm,
+                                color=ON_COLOR,
+                                bgcolor=SUCCESS,
+                            ),
+                        ],
+                        alignment=ft.MainAxisAlignment.END,
+                        spacing=8,
+                    )
+                ],
+                actions_alignment=ft.MainAxisAlignment.END,
+                on_dismiss=lambda _e: _close_dialog(),
+            )
+            self._save_dialog = dlg
+            self._save_user_dd = user_dd
+            self._save_count_text = count_text
+            self._save_user_options = None
+
+        user_dd = self._save_user_dd
+        if user_options is not self._save_user_options:
+            user_dd.options = [ft.dropdown.Option(opt) for opt in user_options]
+            self._save_user_options = user_options
+        user_dd.value = None
+        self._save_count_text.value = f"Save report to history? ({len(controls)} card)"
 
         open_dialog(page, dlg)
 
+    def _get_user_options(self) -> list[str]:
+        """Return the user options from data_app/settings/user.txt.
+
+        The parsed list is cached against the file's mtime, so the file is only
+        read again after it changes.
+        """
+        defaults = ["Alice", "Bob", "Charlie"]
+        path = data_app_path("user.txt", folder_name="data_app/settings")
+        try:
+            mtime = os.stat(path).st_mtime_ns
+        except OSError:
+            mtime = None
+
+        cached = self._user_options_cache
+        if cached is not None and mtime is not None and cached[0] == mtime:
+            return cached[1]
+
+        try:
+            _p, user_options, _created, _err = load_settings_options(
+                filename="user.txt",
+                defaults=defaults,
+            )
+        except Exception:
+            user_options = []
+        if not user_options:
+            user_options = defaults
+
+        if mtime is None:
+            # The file may have just been created from the defaults.
+            try:
+                mtime = os.stat(path).st_mtime_ns
+            except OSError:
+                mtime = None
+        self._user_options_cache = (
+            (mtime, user_options) if mtime is not None else None
+        )
+        return user_options
+
     def _on_add_card(self, e):
         try:
             self.report_list.append_item_issue(focus=True)
@@ -983,57 +1017,61 @@ class ReportEditor(ft.Container):
         except Exception:
             pass
 
-        def _close_dialog(_e=None):
-            try:
-                dlg.open = False
-                page.update()
-            except Exception:
-                pass
+        dlg = self._clear_dialog
+        if dlg is None or dlg.page is not page:
 
-        def _confirm(_e=None):
-            try:
-                self.report_list.clear_all(backup=True)
-                self._sync_restore_enabled(page)
+            def _close_dialog(_e=None):
                 try:
-                    self._persist_draft_now()
+                    dlg.open = False
+                    page.update()
                 except Exception:
                     pass
-            finally:
-                _close_dialog()
-
-        dlg = ft.AlertDialog(
-            modal=True,
-            title=ft.Text("Confirm"),
-            content=ft.Container(
-                content=ft.Text("Clear all cards?"),
-                padding=ft.padding.all(12),
-                bgcolor=ft.Colors.WHITE,
-                border=ft.border.all(1, ft.Colors.BLACK12),
-                border_radius=10,
-            ),
-            actions=[
-                ft.Row(
-                    controls=[
-                        ft.ElevatedButton(
-                            "Cancel",
-                            on_click=_close_dialog,
-                            color=ON_COLOR,
-                            bgcolor=DANGER,
-                        ),
-                        ft.ElevatedButton(
-                            "Clear",
-                            on_click=_confirm,
-                            color=ON_COLOR,
-                            bgcolor=DANGER,
-                        ),
-                    ],
-                    alignment=ft.MainAxisAlignment.END,
-                    spacing=8,
-                )
-            ],
-            actions_alignment=ft.MainAxisAlignment.END,
-            on_dismiss=lambda _e: _close_dialog(),
-        )
+
+            def _confirm(_e=None):
+                try:
+                    self.report_list.clear_all(backup=True)
+                    self._sync_restore_enabled(page)
+                    try:
+                        self._persist_draft_now()
+                    except Exception:
+                        pass
+                finally:
+                    _close_dialog()
+
+            dlg = ft.AlertDialog(
+                modal=True,
+                title=ft.Text("Confirm"),
+                content=ft.Container(
+                    content=ft.Text("Clear all cards?"),
+                    padding=ft.padding.all(12),
+                    bgcolor=ft.Colors.WHITE,
+                    border=ft.border.all(1, ft.Colors.BLACK12),
+                    border_radius=10,
+                ),
+                actions=[
+                    ft.Row(
+                        controls=[
+                            ft.ElevatedButton(
+                                "Cancel",
+                                on_click=_close_dialog,
+                                color=ON_COLOR,
+                                bgcolor=DANGER,
+                            ),
+                            ft.ElevatedButton(
+                                "Clear",
+                                on_click=_confirm,
+                                color=ON_COLOR,
+                                bgcolor=DANGER,
+                            ),
+                        ],
+                        alignment=ft.MainAxisAlignment.END,
+                        spacing=8,
+                    )
+                ],
+                actions_alignment=ft.MainAxisAlignment.END,
+                on_dismiss=lambda _e: _close_dialog(),
+            )
+            self._clear_dialog = dlg
 
         open_dialog(page, dlg)
 
@@ -1081,7 +1119,6 @@ class ReportEditor(ft.Container):
         except Exception:
             report_text = ""
 
-        payload = report_text
         include_table = True
         try:
             if callable(getattr(self, "_get_include_table_cb", None)):
@@ -1089,20 +1126,22 @@ class ReportEditor(ft.Container):
         except Exception:
             include_table = True
 
+        # Payload: meta line, then the table (blank line after it), then the
+        # report; the pieces are joined once instead of re-concatenated.
+        parts = [f"*{func_location.upper()} {link_up[-2:]} | {date_field} | {shift}*"]
         if include_table and callable(getattr(self, "_get_report_table_text_cb", None)):
             try:
                 table_text: str = self._get_report_table_text_cb()
-                replaced_table_text = table_text.replace("\n", "`\n`")
-                formatted_table_text = f"`{replaced_table_text}`".strip()
                 if table_text:
-                    payload = f"{formatted_table_text}\n\n{report_text}".strip()
+                    # Each table line wrapped in backticks (monospace in chat).
+                    lines = table_text.split("\n")
+                    parts.append("`" + "`\n`".join(lines) + "`")
+                    parts.append("")
             except Exception:
                 pass
-
-        meta_line = (
-            f"*{func_location.upper()} {link_up[-2:]} | {date_field} | {shift}*"
-        ).strip()
-        payload = f"{meta_line}\n{payload}".strip()
+        if report_text:
+            parts.append(report_text)
+        payload = "\n".join(parts).rstrip()
 
         QrCodeDialog(page=page, payload=payload).show()
 
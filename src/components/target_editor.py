@@ -6,7 +6,7 @@ import csv
 import flet as ft
 
 from src.utils.file_lock import is_file_locked_windows
-from src.utils.helpers import data_app_path, load_targets_csv
+from src.utils.helpers import csv_cell, data_app_path, load_targets_csv
 from src.utils.theme import DANGER, ON_COLOR, PRIMARY, SECONDARY
 from src.utils.ui_helpers import open_dialog, snack
 
@@ -586,8 +586,9 @@ class TargetEditorDialog:
                             return (False, f"Failed to create template CSV: {err}")
 
                     with csv_path.open("r", newline="", encoding="utf-8-sig") as f:
-                        reader = csv.DictReader(f)
-                        fns = list(reader.fieldnames or [])
+                        reader = csv.reader(f)
+                        fns = next(reader, [])
+                        col_idx = {c: i for i, c in enumerate(fns)}
 
                         metric_col = None
                         for candidate in ("Metrics", "Metric", "METRICS", "METRIC"):
@@ -603,15 +604,17 @@ class TargetEditorDialog:
                         if not scols:
                             return (False, "Shift columns not found in CSV")
 
+                        metric_pos = col_idx[metric_col]
+                        shift_pos = [(sc, col_idx[sc]) for sc in scols]
                         order: list[str] = []
                         values: dict[str, dict[str, str]] = {}
                         for row in reader:
-                            metric = str(row.get(metric_col, "") or "").strip()
+                            metric = csv_cell(row, metric_pos)
                             if not metric:
                                 continue
                             order.append(metric)
                             values[metric] = {
-                                sc: str(row.get(sc, "") or "").strip() for sc in scols
+                                sc: csv_cell(row, pos) for sc, pos in shift_pos
                             }
 
                     return (
@@ -16,9 +16,11 @@ environment = "production"
 # - history_max_rows: limits how many latest history rows are rendered in the History dialog
 # - qr_cache_size: number of QR payloads cached in memory to speed up repeated opens
 # - spa_cache_ttl_seconds: cache TTL for Get Data results (same inputs) to speed repeated clicks
+# - history_search_debounce_ms: pause after the last keystroke before the History search runs
 history_max_rows = 500
 qr_cache_size = 20
 spa_cache_ttl_seconds = 15
+history_search_debounce_ms = 150
 
 [MARQUEE]
 # Running text shown in the editor header. Surrounding spaces are kept as-is.
@@ -161,6 +163,7 @@ class UiConfig:
     history_max_rows: int = 500
     qr_cache_size: int = 20
     spa_cache_ttl_seconds: int = 15
+    history_search_debounce_ms: int = 150
 
 
 @dataclass(frozen=True)
@@ -325,6 +328,7 @@ def get_ui_config() -> tuple[UiConfig, str | None]:
     history_max_rows = _i("history_max_rows", 500)
     qr_cache_size = _i("qr_cache_size", 20)
     spa_cache_ttl_seconds = _i("spa_cache_ttl_seconds", 15)
+    history_search_debounce_ms = _i("history_search_debounce_ms", 150)
 
     # Clamp to sensible ranges (prevents accidental huge values)
     if history_max_rows <= 0:
@@ -342,10 +346,16 @@ def get_ui_config() -> tuple[UiConfig, str | None]:
     if spa_cache_ttl_seconds > 600:
         spa_cache_ttl_seconds = 600
 
+    if history_search_debounce_ms < 0:
+        history_search_debounce_ms = 0
+    if history_search_debounce_ms > 2000:
+        history_search_debounce_ms = 2000
+
     return UiConfig(
         history_max_rows=history_max_rows,
         qr_cache_size=qr_cache_size,
         spa_cache_ttl_seconds=spa_cache_ttl_seconds,
+        history_search_debounce_ms=history_search_debounce_ms,
     ), None
 
 
@@ -26,10 +26,12 @@ SESUDAH:
 from __future__ import annotations
 
 import csv
+import heapq
 import os
 import uuid
 from datetime import date as _date
 from datetime import datetime
+from operator import itemgetter
 from pathlib import Path
 from typing import Any, Callable, Iterable
 
@@ -65,6 +67,16 @@ def _history_storage_mode() -> str:
         return "local_sync"
 
 
+def history_search_is_literal() -> bool:
+    """Return True when filtered reads match `q` as a literal substring.
+
+    Local+Sync filters in Python (`q in value.lower()`). Shared SQLite uses
+    LIKE, which treats `_` and `%` as wildcards and folds only ASCII case,
+    so a Python re-test of its results can disagree with it.
+    """
+    return _history_storage_mode() != "shared_sqlite"
+
+
 def _shared_db_path_from_config_or_env() -> str:
     env_path = str(os.environ.get("DAILY_REPORT_SHARED_DB_PATH", "") or "").strip()
     if env_path:
@@ -323,6 +335,14 @@ def cleanup_sync_files(
 
 
 def _normalize_history_row(row: dict[str, Any]) -> dict[str, str]:
+    # Common case (a dict whose values str() cleanly) in one comprehension;
+    # the per-field fallback only runs when that raises.
+    try:
+        get = (row or {}).get
+        return {k: str(get(k, "") or "") for k in HISTORY_FIELDNAMES}
+    except Exception:
+        pass
+
     out: dict[str, str] = {}
     for k in HISTORY_FIELDNAMES:
         try:
@@ -364,27 +384,58 @@ def _date_key(date_field: Any) -> int:
         return 0
 
 
-def _sort_rows_for_view(rows: Iterable[dict[str, Any]]) -> list[dict[str, str]]:
+# Sort fields of a normalized row, fetched in one C call.
+_VIEW_SORT_FIELDS = itemgetter(
+    "date_field",
+    "shift",
+    "saved_at",
+    "save_id",
+    "card_index",
+    "detail_index",
+    "action_index",
+)
+
+
+def _sort_rows_for_view(
+    rows: Iterable[dict[str, Any]], limit: int | None = None
+) -> list[dict[str, str]]:
+    """Normalize and sort rows in history view order.
+
+    With `limit`, only the first `limit` rows are returned; when that is a
+    small slice of the input a bounded heap is used instead of a full sort.
+    """
     normalized = [_normalize_history_row(r) for r in (rows or [])]
     if not normalized:
         return []
 
-    def _key(r: dict[str, str]):
+    # Normalized rows have every field as str, so no .get()/str() per field.
+    # Helpers are bound as defaults to keep lookups local inside the key.
+    def _key(
+        r: dict[str, str],
+        _fields=_VIEW_SORT_FIELDS,
+        _date_key=_date_key,
+        _shift_key=_shift_key,
+        _int=_parse_int,
+    ):
+        d, sh, sa, si, ci, di, ai = _fields(r)
         return (
-            _date_key(r.get("date_field", "")),
-            _shift_key(r.get("shift", "")),
-            str(r.get("shift", "") or "").strip().lower(),
-            str(r.get("saved_at", "") or ""),
-            str(r.get("save_id", "") or ""),
-            _parse_int(r.get("card_index", "")),
-            _parse_int(r.get("detail_index", "")),
-            _parse_int(r.get("action_index", "")),
+            _date_key(d),
+            _shift_key(sh),
+            sh.strip().lower(),
+            sa,
+            si,
+            _int(ci),
+            _int(di),
+            _int(ai),
         )
 
     try:
-        return sorted(normalized, key=_key)
+        if limit and 0 < limit < len(normalized) // 2:
+            return heapq.nsmallest(limit, normalized, key=_key)
+        out = sorted(normalized, key=_key)
+        return out[:limit] if limit and limit > 0 else out
     except Exception:
-        return normalized
+        return normalized[:limit] if limit and limit > 0 else normalized
 
 
 # ==================== ADAPTER FUNCTIONS ====================
@@ -454,8 +505,51 @@ def read_history_tail(
     if lim <= 0:
         lim = 500
 
-    rows = _sort_rows_for_view(service.get_all_rows())
-    return list(HISTORY_FIELDNAMES), total, rows[:lim]
+    # SQLite bounds the candidates; the view order is always the Python key,
+    # so the tail matches the filtered and exported views of the same rows.
+    rows = _sort_rows_for_view(service.get_tail_candidates(lim), limit=lim)
+    return list(HISTORY_FIELDNAMES), total, rows
+
+
+def read_history_max_row_id(*, db_path: Path) -> int:
+    """Return the local row_id high-water mark (0 in shared_sqlite mode).
+
+    Pair with `read_history_since` to fetch only rows added by a later sync.
+    """
+    if _history_storage_mode() == "shared_sqlite":
+        return 0
+
+    service = _get_sync_service()
+    return int(service.get_max_row_id() or 0)
+
+
+def read_history_since(
+    *,
+    db_path: Path,
+    after_row_id: int,
+    limit: int,
+) -> tuple[int, int, list[dict[str, str]]]:
+    """Return (max_row_id, total_rows, new_rows) for rows after `after_row_id`.
+
+    `new_rows` are in view order and capped at `limit`. In shared_sqlite mode
+    there is no local sync, so no rows are returned.
+    """
+    if _history_storage_mode() == "shared_sqlite":
+        from src.services.history_db_service import count_history_rows as _count
+
+        return 0, int(_count(_resolve_db_path(db_path)) or 0), []
+
+    service = _get_sync_service()
+    max_row_id = int(service.get_max_row_id() or 0)
+    total = int(service.count_rows() or 0)
+    lim = int(limit or 0) or 500
+    if lim <= 0:
+        lim = 500
+
+    rows = _sort_rows_for_view(
+        service.get_tail_candidates(lim, after_row_id=after_row_id), limit=lim
+    )
+    return max_row_id, total, rows
 
 
 def read_history_filtered_tail(
@@ -489,13 +583,9 @@ def read_history_filtered_tail(
     if lim <= 0:
         lim = 500
 
-    all_rows = _sort_rows_for_view(service.get_all_rows())
-    matches = [
-        r
-        for r in all_rows
-        if any(q_s in str(r.get(c, "") or "").lower() for c in fields)
-    ]
-    return len(matches), matches[:lim]
+    # Filter first, then only order the rows that will be returned.
+    matches = service.get_rows_matching(q_s, fields)
+    return len(matches), _sort_rows_for_view(matches, limit=lim)
 
 
 def read_history_filtered_tail_no_count(
@@ -531,13 +621,8 @@ def read_history_filtered_tail_no_count(
     if lim <= 0:
         lim = 500
 
-    all_rows = _sort_rows_for_view(service.get_all_rows())
-    matches = [
-        r
-        for r in all_rows
-        if any(q_s in str(r.get(c, "") or "").lower() for c in fields)
-    ]
-    return matches[:lim]
+    matches = service.get_rows_matching(q_s, fields)
+    return _sort_rows_for_view(matches, limit=lim)
 
 
 def read_last_saved_user_date_shift(
@@ -607,28 +692,30 @@ def export_history_db_to_csv(
 
     q_s = str(q or "").strip().lower()
     service = _get_sync_service()
-    all_rows = _sort_rows_for_view(service.get_all_rows())
 
     if q_s:
-        matches = [
-            r
-            for r in all_rows
-            if any(q_s in str(r.get(c, "") or "").lower() for c in fields)
-        ]
+        matches = _sort_rows_for_view(service.get_rows_matching(q_s, fields))
     else:
-        matches = list(all_rows)
+        matches = _sort_rows_for_view(service.get_all_rows())
 
     matches_total = len(matches)
-    exported = 0
 
-    with export_path.open("w", newline="", encoding="utf-8-sig") as f:
-        writer = csv.DictWriter(f, fieldnames=fields)
-        writer.writeheader()
-        for r in matches:
-            writer.writerow({k: str(r.get(k, "") or "") for k in fields})
-            exported += 1
+    # Sorted rows are normalized (every field present as str), so the
+    # exported columns can be pulled with one itemgetter call per row.
+    get_values = itemgetter(*fields)
+    if len(fields) == 1:
+        values = ([get_values(r)] for r in matches)
+    else:
+        values = map(get_values, matches)
+
+    with export_path.open(
+        "w", newline="", encoding="utf-8-sig", buffering=1 << 20
+    ) as f:
+        writer = csv.writer(f)
+        writer.writerow(fields)
+        writer.writerows(values)
 
-    return exported, matches_total
+    return matches_total, matches_total
 
 
 def save_report_history_sqlite(
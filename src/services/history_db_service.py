@@ -8,7 +8,18 @@ from datetime import datetime
 from pathlib import Path
 from typing import Any, Callable, Iterable
 
-from src.services.history_schema import HISTORY_FIELDNAMES, build_history_rows
+from src.services.history_fts import (
+    drop_history_fts_triggers,
+    ensure_history_fts,
+    history_fts_available,
+    history_fts_filter,
+    history_fts_indexed_through,
+)
+from src.services.history_schema import (
+    HISTORY_FIELDNAMES,
+    HISTORY_SELECT_COLS,
+    build_history_rows,
+)
 from src.services.network_safe_db import connect_network_safe, file_lock_context
 
 
@@ -97,6 +108,12 @@ def _create_schema(conn: sqlite3.Connection) -> None:
         "CREATE INDEX IF NOT EXISTS ix_history_date_field ON history_rows(date_field)"
     )
     conn.execute("CREATE INDEX IF NOT EXISTS ix_history_user ON history_rows(user)")
+    # Matches the leading ORDER BY term of the tail query, so the newest rows
+    # are read in index order and the LIMIT stops the scan early.
+    conn.execute(
+        "CREATE INDEX IF NOT EXISTS ix_history_date_desc "
+        "ON history_rows(COALESCE(date_field, '') DESC)"
+    )
 
 
 def _restore_or_rollover_corrupt_db(db_path: Path) -> None:
@@ -184,6 +201,9 @@ def append_history_rows(db_path: Path, rows: Iterable[dict[str, Any]]) -> int:
     values = [tuple(r[c] for c in HISTORY_FIELDNAMES) for r in normalized]
 
     with _connect(db_path, for_write=True) as conn:
+        # Triggers left by an older version would make this insert fail on a
+        # client without FTS5 (no-op once they are gone).
+        drop_history_fts_triggers(conn)
         conn.execute("BEGIN")
         try:
             conn.executemany(
@@ -192,6 +212,12 @@ def append_history_rows(db_path: Path, rows: Iterable[dict[str, Any]]) -> int:
             )
             conn.commit()
 
+            # The optional trigram index (see history_fts) is only created
+            # and caught up here, under the write lock of a save; read paths
+            # never write to the shared DB. No triggers on this DB, so the
+            # new rows are indexed now (a no-op on clients without FTS5).
+            ensure_history_fts(conn, triggers=False)
+
             # Keep a best-effort backup after a successful commit.
             # If the DB is already corrupt, quick_check may fail; we then skip backup.
             try:
@@ -297,7 +323,7 @@ def read_history_tail(
         detail_i = "CAST(COALESCE(detail_index, '0') AS INT)"
         action_i = "CAST(COALESCE(action_index, '0') AS INT)"
 
-        cols = ",".join(HISTORY_FIELDNAMES)
+        cols = HISTORY_SELECT_COLS
         cur = conn.execute(
             " ".join(
                 [
@@ -359,6 +385,40 @@ def read_last_saved_user_date_shift(db_path: Path) -> tuple[str, str, str] | Non
         return None
 
 
+def _like_where(fields: list[str]) -> str:
+    """Return `col LIKE ? OR ...` over `fields` for a lowercased %q% pattern.
+
+    SQLite's LIKE already ignores ASCII case (and LOWER() only folds ASCII
+    too), and a NULL column never matches, so the columns are compared as
+    stored instead of through LOWER(COALESCE(...)) on every row.
+    """
+    return " OR ".join(f"{c} LIKE ?" for c in fields)
+
+
+def _with_fts_prefilter(
+    conn: sqlite3.Connection,
+    q: str,
+    fields: list[str],
+    where: str,
+    params: list[Any],
+) -> tuple[str, list[Any]]:
+    """AND the FTS index prefilter in front of a LIKE `where`, when usable.
+
+    The LIKE clause stays as the exact check, so results are unchanged.
+    Queries containing `%` or `_` skip the index: LIKE treats those as
+    wildcards, while the FTS phrase would only match them literally.
+    """
+    if "%" in q or "_" in q:
+        return where, params
+    mark = history_fts_indexed_through(conn)
+    if mark is None:
+        return where, params
+    fts = history_fts_filter(q, fields, mark)
+    if fts is None or not history_fts_available(conn):
+        return where, params
+    return f"{fts[0]} AND ({where})", [*fts[1], *params]
+
+
 def read_history_filtered_tail(
     *,
     db_path: Path,
@@ -385,11 +445,11 @@ def read_history_filtered_tail(
     if not fields:
         return 0, []
 
-    # Build a SQL WHERE clause: lower(col) LIKE ? OR ...
+    # Build a SQL WHERE clause: col LIKE ? OR ... (see _like_where)
     q_l = q.lower()
     like = f"%{q_l}%"
 
-    where = " OR ".join([f"LOWER(COALESCE({c}, '')) LIKE ?" for c in fields])
+    where = _like_where(fields)
     params = [like] * len(fields)
 
     date_expr = "COALESCE(date_field, '')"
@@ -406,10 +466,11 @@ def read_history_filtered_tail(
     action_i = "CAST(COALESCE(action_index, '0') AS INT)"
 
     with _connect(db_path) as conn:
+        where, params = _with_fts_prefilter(conn, q, fields, where, params)
         cur = conn.execute(f"SELECT COUNT(*) FROM history_rows WHERE {where}", params)
         matches_total = int((cur.fetchone() or [0])[0] or 0)
 
-        cols = ",".join(HISTORY_FIELDNAMES)
+        cols = HISTORY_SELECT_COLS
         cur = conn.execute(
             " ".join(
                 [
@@ -463,7 +524,7 @@ def read_history_filtered_tail_no_count(
     q_l = q.lower()
     like = f"%{q_l}%"
 
-    where = " OR ".join([f"LOWER(COALESCE({c}, '')) LIKE ?" for c in fields])
+    where = _like_where(fields)
     params = [like] * len(fields)
 
     date_expr = "COALESCE(date_field, '')"
@@ -480,7 +541,8 @@ def read_history_filtered_tail_no_count(
     action_i = "CAST(COALESCE(action_index, '0') AS INT)"
 
     with _connect(db_path) as conn:
-        cols = ",".join(HISTORY_FIELDNAMES)
+        where, params = _with_fts_prefilter(conn, q, fields, where, params)
+        cols = HISTORY_SELECT_COLS
         cur = conn.execute(
             " ".join(
                 [
@@ -537,15 +599,15 @@ def export_history_db_to_csv(
     if q:
         q_l = q.lower()
         like = f"%{q_l}%"
-        where = " WHERE " + " OR ".join(
-            [f"LOWER(COALESCE({c}, '')) LIKE ?" for c in fields]
-        )
+        where = _like_where(fields)
         params = [like] * len(fields)
 
     select_cols = ",".join(fields)
 
     with _connect(db_path) as conn:
         if where:
+            where, params = _with_fts_prefilter(conn, q, fields, where, params)
+            where = f" WHERE {where}"
             cur = conn.execute(
                 f"SELECT COUNT(*) FROM history_rows{where}",
                 params,
@@ -561,19 +623,18 @@ def export_history_db_to_csv(
         )
 
         exported = 0
-        with export_path.open("w", newline="", encoding="utf-8-sig") as f:
-            writer = csv.DictWriter(f, fieldnames=fields)
-            writer.writeheader()
+        with export_path.open(
+            "w", newline="", encoding="utf-8-sig", buffering=1 << 20
+        ) as f:
+            # Cursor rows are already tuples in `fields` order; csv.writer
+            # writes None as "" and str() for everything else.
+            writer = csv.writer(f)
+            writer.writerow(fields)
             while True:
                 batch = cur.fetchmany(2000)
                 if not batch:
                     break
-                for row in batch:
-                    out = {
-                        fields[i]: ("" if row[i] is None else str(row[i]))
-                        for i in range(len(fields))
-                    }
-                    writer.writerow(out)
-                    exported += 1
+                writer.writerows(batch)
+                exported += len(batch)
 
     return exported, matches_total
@@ -0,0 +1,242 @@
+"""
+Full-text index (SQLite FTS5, trigram tokenizer) for history search.
+
+History search is a case-insensitive substring match over the visible
+columns. A trigram FTS5 index answers that kind of query without scanning
+every row, so the filter paths use it to narrow candidates first and then
+keep their existing exact match on top.
+
+The index is optional. When this SQLite cannot run a trigram MATCH (no FTS5
+or no trigram tokenizer, checked with a real query), or the query is shorter
+than 3 characters (no full trigram), the callers fall back to the plain scan.
+
+How the index is kept current depends on who opens the database:
+- The Local+Sync DB is only ever opened by this machine, so triggers on
+  history_rows maintain it.
+- The shared network DB is opened by every client, and a trigger that
+  writes to an FTS5 table fails on a client without FTS5, which would break
+  every insert there. So it has no triggers: history_fts_state records the
+  last indexed row_id, clients that can use the index create it and catch it
+  up when they save (sync_history_fts), and rows after that mark go through
+  the plain scan. Reads only check whether the index can be used.
+
+The index stores trigrams of every searchable column, so it makes the
+database (and the shared DB's .bak copy) a few times larger.
+"""
+
+from __future__ import annotations
+
+import sqlite3
+
+from src.services.history_schema import HISTORY_FIELDNAMES
+
+HISTORY_FTS_TABLE = "history_fts"
+HISTORY_FTS_STATE_TABLE = "history_fts_state"
+
+# Trigram tokenizer: queries shorter than this cannot use the index.
+_MIN_QUERY_CHARS = 3
+
+_TRIGGER_NAMES = tuple(f"{HISTORY_FTS_TABLE}_{s}" for s in ("ai", "ad", "au"))
+
+
+def _table_exists(conn: sqlite3.Connection, name: str) -> bool:
+    row = conn.execute(
+        "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = ?",
+        (name,),
+    ).fetchone()
+    return row is not None
+
+
+def ensure_history_fts(conn: sqlite3.Connection, *, triggers: bool = True) -> bool:
+    """Create the FTS index over history_rows if missing and bring it current.
+
+    With `triggers` (local DB), insert/delete/update triggers maintain the
+    index. Without (shared DB), any such triggers are dropped and the index
+    is caught up from history_fts_state instead. The first creation also
+    indexes the rows that already exist.
+
+    Returns True when the index is available to this SQLite.
+    """
+    t = HISTORY_FTS_TABLE
+    try:
+        if not triggers:
+            drop_history_fts_triggers(conn)
+
+        if not _table_exists(conn, t):
+            conn.execute("BEGIN")
+            try:
+                conn.execute(
+                    f"CREATE VIRTUAL TABLE {t} USING fts5("
+                    f"{', '.join(HISTORY_FIELDNAMES)}, content='history_rows', "
+                    "content_rowid='row_id', tokenize='trigram')"
+                )
+                conn.commit()
+            except Exception:
+                conn.rollback()
+                raise
+
+        if not history_fts_available(conn):
+            return False
+
+        if triggers:
+            _ensure_triggers(conn)
+        else:
+            sync_history_fts(conn)
+        return True
+    except sqlite3.Error:
+        # No FTS5 / trigram tokenizer in this SQLite build: keep plain scans.
+        return False
+
+
+def drop_history_fts_triggers(conn: sqlite3.Connection) -> None:
+    """Drop the index triggers (shared DB; they may predate the state mark).
+
+    Dropping needs no FTS5, so even a client that cannot use the index
+    removes triggers that would make its inserts fail.
+    """
+    try:
+        for name in _TRIGGER_NAMES:
+            conn.execute(f"DROP TRIGGER IF EXISTS {name}")
+    except sqlite3.Error:
+        pass
+
+
+def _ensure_triggers(conn: sqlite3.Connection) -> None:
+    t = HISTORY_FTS_TABLE
+    cols = ", ".join(HISTORY_FIELDNAMES)
+    new_vals = ", ".join(f"new.{c}" for c in HISTORY_FIELDNAMES)
+    old_vals = ", ".join(f"old.{c}" for c in HISTORY_FIELDNAMES)
+    insert_new = f"INSERT INTO {t}(rowid, {cols}) VALUES (new.row_id, {new_vals});"
+    delete_old = (
+        f"INSERT INTO {t}({t}, rowid, {cols}) "
+        f"VALUES ('delete', old.row_id, {old_vals});"
+    )
+
+    row = conn.execute(
+        "SELECT sql FROM sqlite_master WHERE type = 'trigger' AND name = ?",
+        (f"{t}_au",),
+    ).fetchone()
+    # Up to date: the update trigger only fires for the indexed columns, so
+    # bookkeeping updates (synced_at, sync_hash) leave the index alone.
+    if row is not None and " UPDATE OF " in str(row[0] or "").upper():
+        return
+
+    conn.execute("BEGIN")
+    try:
+        for name in _TRIGGER_NAMES:
+            conn.execute(f"DROP TRIGGER IF EXISTS {name}")
+        conn.execute(
+            f"CREATE TRIGGER {t}_ai AFTER INSERT ON history_rows "
+            f"BEGIN {insert_new} END"
+        )
+        conn.execute(
+            f"CREATE TRIGGER {t}_ad AFTER DELETE ON history_rows "
+            f"BEGIN {delete_old} END"
+        )
+        conn.execute(
+            f"CREATE TRIGGER {t}_au AFTER UPDATE OF {cols} ON history_rows "
+            f"BEGIN {delete_old} {insert_new} END"
+        )
+        if row is None:
+            # No trigger kept the index current before: index every row.
+            conn.execute(f"INSERT INTO {t}({t}) VALUES ('rebuild')")
+        conn.commit()
+    except Exception:
+        conn.rollback()
+        raise
+
+
+def sync_history_fts(conn: sqlite3.Connection) -> None:
+    """Index the history_rows added after the history_fts_state mark.
+
+    Used for the shared DB, which has no triggers. Without a mark yet (new
+    index, or one a trigger-maintained version left behind) the whole index
+    is rebuilt once. Call with the write lock held; raises sqlite3.Error when
+    this SQLite cannot write the index.
+    """
+    t = HISTORY_FTS_TABLE
+    s = HISTORY_FTS_STATE_TABLE
+    cols = ", ".join(HISTORY_FIELDNAMES)
+
+    mark = history_fts_indexed_through(conn)
+    row = conn.execute("SELECT COALESCE(MAX(row_id), 0) FROM history_rows").fetchone()
+    max_row_id = int(row[0] or 0)
+    if mark is not None and mark >= max_row_id:
+        return
+
+    conn.execute("BEGIN")
+    try:
+        conn.execute(
+            f"CREATE TABLE IF NOT EXISTS {s} "
+            "(id INTEGER PRIMARY KEY CHECK (id = 1), last_row_id INTEGER NOT NULL)"
+        )
+        if mark is None:
+            conn.execute(f"INSERT INTO {t}({t}) VALUES ('rebuild')")
+        else:
+            conn.execute(
+                f"INSERT INTO {t}(rowid, {cols}) "
+                f"SELECT row_id, {cols} FROM history_rows "
+                "WHERE row_id > ? AND row_id <= ?",
+                (mark, max_row_id),
+            )
+        conn.execute(
+            f"INSERT OR REPLACE INTO {s}(id, last_row_id) VALUES (1, ?)",
+            (max_row_id,),
+        )
+        conn.commit()
+    except Exception:
+        conn.rollback()
+        raise
+
+
+def history_fts_indexed_through(conn: sqlite3.Connection) -> int | None:
+    """Return the last row_id indexed in a trigger-less DB (None if unknown)."""
+    try:
+        row = conn.execute(
+            f"SELECT last_row_id FROM {HISTORY_FTS_STATE_TABLE} WHERE id = 1"
+        ).fetchone()
+    except sqlite3.Error:
+        return None
+    return int(row[0]) if row is not None and row[0] is not None else None
+
+
+def history_fts_available(conn: sqlite3.Connection) -> bool:
+    """Return True when this SQLite can run a MATCH on the history index.
+
+    The index can exist in a database created by another client, so this
+    runs a real trigram MATCH instead of only looking it up in sqlite_master.
+    """
+    t = HISTORY_FTS_TABLE
+    try:
+        conn.execute(f"SELECT rowid FROM {t} WHERE {t} MATCH ? LIMIT 1", ('"fts"',))
+        return True
+    except sqlite3.Error:
+        return False
+
+
+def history_fts_filter(
+    q: str, fields: list[str], indexed_through: int | None = None
+) -> tuple[str, list] | None:
+    """Return (sql, params) restricting history_rows.row_id to FTS matches.
+
+    The condition is a superset-safe prefilter: callers AND it with their
+    own exact match. With `indexed_through` (trigger-less DB), rows added
+    after that row_id are not in the index yet and always pass.
+    Returns None when the index cannot help (query too short or no
+    searchable fields).
+    """
+    q = str(q or "").strip()
+    cols = [c for c in (fields or []) if c in HISTORY_FIELDNAMES]
+    if len(q) < _MIN_QUERY_CHARS or not cols:
+        return None
+
+    # Column filter + one quoted phrase: a trigram phrase is a substring match.
+    phrase = '"' + q.replace('"', '""') + '"'
+    match = "{" + " ".join(cols) + "} : " + phrase
+    sql = (
+        f"row_id IN (SELECT rowid FROM {HISTORY_FTS_TABLE} "
+        f"WHERE {HISTORY_FTS_TABLE} MATCH ?)"
+    )
+    if indexed_through is None:
+        return sql, [match]
+    return f"(row_id > ? OR {sql})", [indexed_through, match]
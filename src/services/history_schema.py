@@ -18,6 +18,10 @@ HISTORY_FIELDNAMES: list[str] = [
     "action",
 ]
 
+# SELECT list for reads that feed the History table: NULL columns come back as
+# "", so every value handed to the UI is already a str.
+HISTORY_SELECT_COLS = ",".join(f"COALESCE({c}, '')" for c in HISTORY_FIELDNAMES)
+
 
 def build_history_rows(
     *,
@@ -13,10 +13,29 @@ from __future__ import annotations
 import json
 import sqlite3
 from datetime import datetime
+from operator import itemgetter
 from pathlib import Path
 from typing import Any, Iterable
 
-from src.services.history_schema import HISTORY_FIELDNAMES
+from src.services.history_fts import (
+    ensure_history_fts,
+    history_fts_available,
+    history_fts_filter,
+)
+from src.services.history_schema import HISTORY_FIELDNAMES, HISTORY_SELECT_COLS
+
+
+def _encode_sync_rows(rows: list[dict[str, Any]]) -> bytes:
+    """Encode rows as the compact UTF-8 JSON of a sync file.
+
+    json.dumps runs the C encoder in one call (json.dump to a file uses the
+    pure-Python iterative encoder and writes many small chunks), and the
+    result goes to the shared folder as a single write. Compact separators
+    keep files small and reduce network write time.
+    """
+    return json.dumps(rows, ensure_ascii=False, separators=(",", ":")).encode(
+        "utf-8"
+    )
 
 
 class LocalSyncDbService:
@@ -66,7 +85,16 @@ class LocalSyncDbService:
             conn.execute(
                 "CREATE INDEX IF NOT EXISTS ix_synced_at ON history_rows(synced_at)"
             )
+            # ORDER BY term of get_tail_candidates: lets SQLite read the
+            # newest dates in index order and stop at the OFFSET.
+            conn.execute(
+                "CREATE INDEX IF NOT EXISTS ix_history_date_desc "
+                "ON history_rows(COALESCE(date_field, '') DESC)"
+            )
             conn.commit()
+
+            # Optional trigram index for substring search (see history_fts).
+            ensure_history_fts(conn)
         finally:
             conn.close()
 
@@ -163,12 +191,12 @@ class LocalSyncDbService:
             sync_file = self.sync_folder / filename
 
             # Export ke JSON
-            with open(sync_file, "w", encoding="utf-8") as f:
-                # Compact JSON to keep files small and reduce network write time.
-                json.dump(unsynced_rows, f, ensure_ascii=False, separators=(",", ":"))
+            data = _encode_sync_rows(unsynced_rows)
+            sync_file.write_bytes(data)
 
-            # Mark sebagai synced dengan hash
-            file_hash = hashlib.md5(sync_file.read_bytes()).hexdigest()
+            # Mark sebagai synced dengan hash (of the bytes just written, so
+            # the file is not read back over the network).
+            file_hash = hashlib.md5(data).hexdigest()
             sync_timestamp = datetime.now().isoformat()
 
             if row_ids:
@@ -212,8 +240,7 @@ class LocalSyncDbService:
             computer_name = platform.node() or "unknown"
             filename = f"fullsync_{computer_name}_{timestamp}.json"
             sync_file = self.sync_folder / filename
-            with open(sync_file, "w", encoding="utf-8") as f:
-                json.dump(all_rows, f, ensure_ascii=False, separators=(",", ":"))
+            sync_file.write_bytes(_encode_sync_rows(all_rows))
             return sync_file
         finally:
             conn.close()
@@ -288,9 +315,14 @@ class LocalSyncDbService:
         return imported_count
 
     def get_all_rows(self) -> list[dict[str, Any]]:
-        """Get all history rows dari local database."""
+        """Get all history rows dari local database.
+
+        Rows are streamed from the cursor as plain tuples and zipped into
+        dicts, so the result is built once (no fetchall() list of Row
+        objects alongside it).
+        """
         conn = sqlite3.connect(self.local_db_path)
-        conn.row_factory = sqlite3.Row
+        names = HISTORY_FIELDNAMES
 
         try:
             cursor = conn.execute(
@@ -300,6 +332,122 @@ class LocalSyncDbService:
                 ORDER BY saved_at DESC
                 """
             )
+            return [dict(zip(names, row)) for row in cursor]
+        finally:
+            conn.close()
+
+    def get_rows_matching(self, q: str, fieldnames: list[str]) -> list[dict[str, Any]]:
+        """Get rows containing `q` (case-insensitive) in any of `fieldnames`.
+
+        Narrowed through the FTS index when it can be used. The exact match
+        runs on the plain cursor tuples, so only matching rows are turned
+        into dicts; non-matches (every row, for queries too short for the
+        index) never become per-row dicts.
+
+        With several search columns, each row's values are joined and
+        lowercased once and tested with a single `in`; a unit separator
+        between values keeps a match from spanning two columns.
+        """
+        q_l = str(q or "").lower()
+        wanted = set(fieldnames or [])
+        positions = [i for i, c in enumerate(HISTORY_FIELDNAMES) if c in wanted]
+        names = HISTORY_FIELDNAMES
+
+        conn = sqlite3.connect(self.local_db_path)
+
+        try:
+            cols = HISTORY_SELECT_COLS
+            fts = history_fts_filter(q, fieldnames)
+            if fts is not None and history_fts_available(conn):
+                cursor = conn.execute(
+                    f"SELECT {cols} FROM history_rows WHERE {fts[0]}", fts[1]
+                )
+            else:
+                cursor = conn.execute(f"SELECT {cols} FROM history_rows")
+            if not q_l:
+                return [dict(zip(names, row)) for row in cursor]
+
+            out: list[dict[str, Any]] = []
+            if len(positions) > 1 and "\x1f" not in q_l:
+                get_values = itemgetter(*positions)
+                join = "\x1f".join
+                for row in cursor:
+                    try:
+                        hit = q_l in join(get_values(row)).lower()
+                    except TypeError:
+                        # Non-text value (e.g. a BLOB): test the fields one by one.
+                        hit = any(v and q_l in str(v).lower() for v in get_values(row))
+                    if hit:
+                        out.append(dict(zip(names, row)))
+                return out
+
+            for row in cursor:
+                for i in positions:
+                    v = row[i]
+                    if v and q_l in str(v).lower():
+                        out.append(dict(zip(names, row)))
+                        break
+            return out
+        finally:
+            conn.close()
+
+    def get_max_row_id(self) -> int:
+        """Return the highest local row_id (0 when the table is empty)."""
+        conn = sqlite3.connect(self.local_db_path)
+        try:
+            cursor = conn.execute("SELECT COALESCE(MAX(row_id), 0) FROM history_rows")
+            return int(cursor.fetchone()[0] or 0)
+        finally:
+            conn.close()
+
+    def get_tail_candidates(
+        self, limit: int, after_row_id: int = 0
+    ) -> list[dict[str, Any]]:
+        """Get a superset of the first `limit` history rows in view order.
+
+        The view order itself (history_db_adapter._sort_rows_for_view) is
+        applied by the caller; this only bounds how many rows reach Python.
+        Rows whose date_field is a valid canonical YYYY-MM-DD date sort by
+        that string, so SQLite finds the `limit`-th newest such date through
+        ix_history_date_desc and only rows on or after it are returned. Every
+        other row (empty, padded or non-ISO dates) is always returned, since
+        only the Python key can place it.
+
+        With `after_row_id`, only rows inserted after that row_id are
+        considered (used for delta refreshes after a sync import).
+        """
+        lim = int(limit or 0)
+        if lim <= 0:
+            lim = 500
+        after = max(0, int(after_row_id or 0))
+
+        date_expr = "COALESCE(date_field, '')"
+        # date(..., '+0 days') normalizes out-of-range days (2024-02-30 becomes
+        # 2024-03-01), so the IS check only passes real calendar dates.
+        canonical = (
+            f"({date_expr} GLOB '[0-9][0-9][0-9][0-9]-[0-9][0-9]-[0-9][0-9]' "
+            f"AND {date_expr} >= '0001' "
+            f"AND date({date_expr}, '+0 days') IS {date_expr})"
+        )
+
+        conn = sqlite3.connect(self.local_db_path)
+        conn.row_factory = sqlite3.Row
+
+        try:
+            row = conn.execute(
+                f"SELECT {date_expr} FROM history_rows "
+                f"WHERE row_id > ? AND {canonical} "
+                f"ORDER BY {date_expr} DESC LIMIT 1 OFFSET ?",
+                (after, lim - 1),
+            ).fetchone()
+            # Fewer than `limit` dated rows: all of them are candidates.
+            boundary = row[0] if row is not None else ""
+
+            cursor = conn.execute(
+                f"SELECT {','.join(HISTORY_FIELDNAMES)} FROM history_rows "
+                f"WHERE row_id > ? AND ({date_expr} >= ? OR NOT {canonical})",
+                (after, boundary),
+            )
             return [dict(row) for row in cursor.fetchall()]
         finally:
             conn.close()
@@ -150,6 +150,17 @@ def ensure_portable_targets_seeded() -> None:
         pass
 
 
+def csv_cell(row: list[str], pos: int | None) -> str:
+    """Return the stripped value at `pos` of a csv.reader row.
+
+    Missing columns (pos None) and short rows give "", like the empty value
+    csv.DictReader would produce.
+    """
+    if pos is None or pos >= len(row):
+        return ""
+    return row[pos].strip()
+
+
 def load_targets_csv(
     *,
     shift: str = "",
@@ -220,8 +231,11 @@ def load_targets_csv(
     targets: dict[str, str] = {}
     try:
         with csv_path.open("r", newline="", encoding="utf-8-sig") as f:
-            reader = csv.DictReader(f)
-            fieldnames = list(reader.fieldnames or [])
+            # Rows are read as lists and indexed by column position: the file
+            # is read once per report refresh and needs only a few columns.
+            reader = csv.reader(f)
+            fieldnames = next(reader, [])
+            col_idx = {c: i for i, c in enumerate(fieldnames)}
 
             # If shift == "", return per-metric average across Shift 1/2/3.
             shift_key = str(shift or "").strip()
@@ -255,17 +269,22 @@ def load_targets_csv(
                         shift_cols[want] = actual
                         break
 
+            metric_pos = col_idx[metric_col]
+            shift_pos = col_idx.get(shift)
+            avg_pos = [
+                col_idx[shift_cols[want]]
+                for want in ("Shift 1", "Shift 2", "Shift 3")
+                if want in shift_cols
+            ]
+
             for row in reader:
-                metric = str(row.get(metric_col, "") or "").strip()
+                metric = csv_cell(row, metric_pos)
                 if metric:
                     if shift_key == "":
                         try:
                             nums: list[float] = []
-                            for want in ("Shift 1", "Shift 2", "Shift 3"):
-                                col_name = shift_cols.get(want)
-                                if not col_name:
-                                    continue
-                                parsed = _parse_float(str(row.get(col_name, "") or ""))
+                            for pos in avg_pos:
+                                parsed = _parse_float(csv_cell(row, pos))
                                 if parsed is not None:
                                     nums.append(parsed)
 
@@ -277,8 +296,7 @@ def load_targets_csv(
                         except Exception:
                             targets[metric] = "N/A"
                     else:
-                        value = str(row.get(shift, "") or "").strip()
-                        targets[metric] = value
+                        targets[metric] = csv_cell(row, shift_pos)
 
         return csv_path, targets, False, None
     except Exception as ex:
@@ -0,0 +1,86 @@
+"""QR code image encoding, kept free of UI imports."""
+
+from __future__ import annotations
+
+import base64
+import zlib
+from struct import pack
+from types import ModuleType
+
+try:
+    # SIMD base64 (libbase64) when installed; the stdlib encoder otherwise.
+    from pybase64 import b64encode_as_string as _b64encode_str
+except ImportError:
+
+    def _b64encode_str(data: bytes) -> str:
+        return base64.b64encode(data).decode("ascii")
+
+# The qrcode module, imported on the first QR built (not at app start).
+_qrcode: ModuleType | None = None
+
+
+def _get_qrcode() -> ModuleType:
+    global _qrcode
+    if _qrcode is None:
+        # Import here so the rest of the app still works even if qrcode isn't
+        # installed.
+        import qrcode
+
+        _qrcode = qrcode
+    return _qrcode
+
+
+def _png_chunk(tag: bytes, data: bytes) -> bytes:
+    body = tag + data
+    return pack(">I", len(data)) + body + pack(">I", zlib.crc32(body))
+
+
+def qr_png(matrix: list[list[bool]], border: int = 0) -> bytes:
+    """Return the QR matrix as a 1-bit grayscale PNG, one pixel per module.
+
+    The PNG is written by hand (IHDR + zlib IDAT + IEND): a two-colour bitmap
+    needs no palette or colour conversion, so neither Pillow nor PyPNG is
+    involved. `border` is the quiet zone in modules around `matrix`. The
+    image is a few hundred bytes; the viewer scales it up without smoothing.
+    """
+    n = len(matrix) + 2 * border
+    row_bytes = (n + 7) // 8
+    # Bit 1 is white, 0 is black; trailing pad bits of a scanline are white.
+    quiet = "1" * border
+    tail = quiet + "1" * (row_bytes * 8 - n)
+    blank = b"\x00" + b"\xff" * row_bytes
+
+    raw = bytearray(blank * border)
+    for row in matrix:
+        bits = "".join(["0" if dark else "1" for dark in row])
+        # Scanline: filter type 0 (None), then the packed bits.
+        raw += b"\x00"
+        raw += int(quiet + bits + tail, 2).to_bytes(row_bytes, "big")
+    raw += blank * border
+
+    ihdr = pack(">IIBBBBB", n, n, 1, 0, 0, 0, 0)
+    return b"".join(
+        (
+            b"\x89PNG\r\n\x1a\n",
+            _png_chunk(b"IHDR", ihdr),
+            _png_chunk(b"IDAT", zlib.compress(raw, 1)),
+            _png_chunk(b"IEND", b""),
+        )
+    )
+
+
+def build_qr_b64(payload: str) -> str:
+    """Encode `payload` as a QR code and return it as a base64 PNG image.
+
+    The PNG is written straight from the module matrix (see qr_png), so no
+    raster image is drawn and no qrcode image factory is involved.
+    """
+    qrcode = _get_qrcode()
+    qr = qrcode.QRCode(
+        error_correction=qrcode.constants.ERROR_CORRECT_M,
+        border=2,
+    )
+    qr.add_data(payload or "")
+    qr.make(fit=True)
+    # qr.modules directly: get_matrix() would copy every row to add the border.
+    return _b64encode_str(qr_png(qr.modules, qr.border))
@@ -0,0 +1,232 @@
+import sqlite3
+import tempfile
+import unittest
+from pathlib import Path
+
+from src.services import history_db_service
+from src.services.history_fts import (
+    HISTORY_FTS_TABLE,
+    history_fts_available,
+    history_fts_indexed_through,
+)
+from src.services.history_schema import HISTORY_FIELDNAMES
+from src.services.local_sync_db_service import LocalSyncDbService
+
+_ISSUES = [
+    "ab_d pump",
+    "abXd pump",
+    "abd pump",
+    "50% off",
+    "50 percent off",
+    "50 off",
+    "Motor trip",
+]
+
+
+def _row(i: int, issue: str) -> dict[str, str]:
+    row = {c: "" for c in HISTORY_FIELDNAMES}
+    row.update(
+        save_id=f"s{i:03d}",
+        saved_at="2024-01-01T08:00:00",
+        date_field="2024-01-01",
+        shift="Shift 1",
+        card_index="1",
+        detail_index="1",
+        action_index=str(i),
+        issue=issue,
+    )
+    return row
+
+
+def _like_scan(db_path: Path, q: str) -> set[str]:
+    conn = sqlite3.connect(db_path)
+    try:
+        cur = conn.execute(
+            "SELECT save_id FROM history_rows WHERE issue LIKE ?",
+            (f"%{q.lower()}%",),
+        )
+        return {r[0] for r in cur}
+    finally:
+        conn.close()
+
+
+def _triggers(db_path: Path) -> list[str]:
+    conn = sqlite3.connect(db_path)
+    try:
+        cur = conn.execute("SELECT name FROM sqlite_master WHERE type = 'trigger'")
+        return [r[0] for r in cur]
+    finally:
+        conn.close()
+
+
+class SharedDbFtsTest(unittest.TestCase):
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.db_path = Path(self._tmp.name) / "history.db"
+
+    def tearDown(self):
+        self._tmp.cleanup()
+
+    def _search(self, q: str) -> set[str]:
+        total, rows = history_db_service.read_history_filtered_tail(
+            db_path=self.db_path, q=q, fieldnames=["issue"], limit=100
+        )
+        self.assertEqual(total, len(rows))
+        return {r["save_id"] for r in rows}
+
+    def test_shared_db_has_no_triggers(self):
+        history_db_service.append_history_rows(
+            self.db_path, [_row(i, s) for i, s in enumerate(_ISSUES)]
+        )
+        self.assertEqual(_triggers(self.db_path), [])
+
+    def test_legacy_triggers_are_dropped(self):
+        history_db_service.ensure_history_db(self.db_path)
+        conn = sqlite3.connect(self.db_path)
+        try:
+            conn.execute(
+                f"CREATE TRIGGER {HISTORY_FTS_TABLE}_ai AFTER INSERT ON history_rows "
+                f"BEGIN INSERT INTO {HISTORY_FTS_TABLE}(rowid, issue) "
+                "VALUES (new.row_id, new.issue); END"
+            )
+            conn.commit()
+        finally:
+            conn.close()
+
+        history_db_service.append_history_rows(self.db_path, [_row(0, "pump")])
+        self.assertEqual(_triggers(self.db_path), [])
+
+    def test_rows_written_without_the_index_are_found(self):
+        history_db_service.append_history_rows(
+            self.db_path, [_row(i, s) for i, s in enumerate(_ISSUES)]
+        )
+        # A client without FTS5 inserts directly, leaving the index behind.
+        conn = sqlite3.connect(self.db_path)
+        try:
+            mark = history_fts_indexed_through(conn)
+            conn.execute(
+                "INSERT INTO history_rows (save_id, issue) VALUES ('raw', 'raw pump')"
+            )
+            conn.commit()
+        finally:
+            conn.close()
+
+        with history_db_service._connect(self.db_path) as conn:
+            where, params = history_db_service._with_fts_prefilter(
+                conn, "pump", ["issue"], "issue LIKE ?", ["%pump%"]
+            )
+            self.assertIn(HISTORY_FTS_TABLE, where)
+            got = {
+                r[0]
+                for r in conn.execute(
+                    f"SELECT save_id FROM history_rows WHERE {where}", params
+                )
+            }
+        self.assertEqual(got, _like_scan(self.db_path, "pump"))
+        self.assertIn("raw", got)
+
+        # Reads leave the index alone; the next save catches it up.
+        self._search("pump")
+        conn = sqlite3.connect(self.db_path)
+        try:
+            self.assertEqual(history_fts_indexed_through(conn), mark)
+        finally:
+            conn.close()
+        history_db_service.append_history_rows(self.db_path, [_row(99, "new")])
+        conn = sqlite3.connect(self.db_path)
+        try:
+            self.assertGreater(history_fts_indexed_through(conn), mark)
+        finally:
+            conn.close()
+
+    def test_reads_do_not_create_the_index(self):
+        history_db_service.ensure_history_db(self.db_path)
+        self.assertEqual(history_db_service.count_history_rows(self.db_path), 0)
+        self.assertEqual(self._search("pump"), set())
+        conn = sqlite3.connect(self.db_path)
+        try:
+            names = {
+                r[0] for r in conn.execute("SELECT name FROM sqlite_master")
+            }
+        finally:
+            conn.close()
+        self.assertNotIn(HISTORY_FTS_TABLE, names)
+
+    def test_unusable_index_falls_back_to_like(self):
+        # An index table this SQLite cannot MATCH on (as on a client without
+        # FTS5): searches and inserts must keep working.
+        conn = sqlite3.connect(self.db_path)
+        try:
+            conn.execute(f"CREATE TABLE {HISTORY_FTS_TABLE} (x TEXT)")
+            conn.commit()
+            self.assertFalse(history_fts_available(conn))
+        finally:
+            conn.close()
+
+        history_db_service.append_history_rows(
+            self.db_path, [_row(i, s) for i, s in enumerate(_ISSUES)]
+        )
+        self.assertEqual(self._search("pump"), _like_scan(self.db_path, "pump"))
+
+    def test_underscore_query_matches_like_scan(self):
+        history_db_service.append_history_rows(
+            self.db_path, [_row(i, s) for i, s in enumerate(_ISSUES)]
+        )
+        got = self._search("ab_d")
+        self.assertEqual(got, _like_scan(self.db_path, "ab_d"))
+        self.assertEqual(len(got), 2)
+
+    def test_percent_query_matches_like_scan(self):
+        history_db_service.append_history_rows(
+            self.db_path, [_row(i, s) for i, s in enumerate(_ISSUES)]
+        )
+        got = self._search("50%off")
+        self.assertEqual(got, _like_scan(self.db_path, "50%off"))
+        self.assertEqual(len(got), 3)
+
+
+class LocalDbFtsTest(unittest.TestCase):
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        root = Path(self._tmp.name)
+        self.service = LocalSyncDbService(root / "history.db", root / "sync")
+
+    def tearDown(self):
+        self._tmp.cleanup()
+
+    def test_update_trigger_only_covers_indexed_columns(self):
+        conn = sqlite3.connect(self.service.local_db_path)
+        try:
+            row = conn.execute(
+                "SELECT sql FROM sqlite_master WHERE name = ?",
+                (f"{HISTORY_FTS_TABLE}_au",),
+            ).fetchone()
+        finally:
+            conn.close()
+        if row is None:
+            self.skipTest("FTS5 trigram not available in this SQLite")
+        sql = row[0].upper()
+        self.assertIn("UPDATE OF", sql)
+        self.assertNotIn("SYNCED_AT", sql.split(" ON ")[0])
+
+    def test_search_after_sync_and_update(self):
+        self.service.append_rows([_row(i, s) for i, s in enumerate(_ISSUES)])
+        self.service.export_to_sync_folder()
+
+        conn = sqlite3.connect(self.service.local_db_path)
+        try:
+            conn.execute(
+                "UPDATE history_rows SET issue = 'Valve stuck' WHERE row_id = 1"
+            )
+            conn.commit()
+        finally:
+            conn.close()
+
+        found = {r["issue"] for r in self.service.get_rows_matching("valve", ["issue"])}
+        self.assertEqual(found, {"Valve stuck"})
+        found = {r["issue"] for r in self.service.get_rows_matching("pump", ["issue"])}
+        self.assertEqual(found, {"abXd pump", "abd pump"})
+
+
+if __name__ == "__main__":
+    unittest.main()
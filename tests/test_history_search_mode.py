@@ -0,0 +1,21 @@
+import os
+import unittest
+from unittest import mock
+
+from src.services.history_db_adapter import history_search_is_literal
+
+_MODE_ENV = "DAILY_REPORT_HISTORY_MODE"
+
+
+class HistorySearchModeTest(unittest.TestCase):
+    def test_shared_sqlite_search_is_not_literal(self):
+        with mock.patch.dict(os.environ, {_MODE_ENV: "shared_sqlite"}):
+            self.assertFalse(history_search_is_literal())
+
+    def test_local_sync_search_is_literal(self):
+        with mock.patch.dict(os.environ, {_MODE_ENV: "local_sync"}):
+            self.assertTrue(history_search_is_literal())
+
+
+if __name__ == "__main__":
+    unittest.main()
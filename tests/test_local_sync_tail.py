@@ -0,0 +1,96 @@
+import random
+import tempfile
+import unittest
+from pathlib import Path
+
+from src.services.history_db_adapter import _sort_rows_for_view
+from src.services.history_schema import HISTORY_FIELDNAMES
+from src.services.local_sync_db_service import LocalSyncDbService
+
+# Canonical dates plus ones only the Python key can place: out-of-range days,
+# padding, other separators, basic ISO format, year 0, empty.
+_DATES = [
+    "2024-03-01",
+    "2024-02-29",
+    "2024-02-28",
+    "2023-12-31",
+    "2024-02-30",
+    " 2024-02-15 ",
+    "\t2024-03-02",
+    "2024/01/01",
+    "20240105",
+    "0000-01-01",
+    "2024-13-01",
+    "",
+]
+_SHIFTS = [
+    "Shift 1",
+    "Shift 2",
+    "shift 3",
+    "shift-3",
+    "3a",
+    "Shift 3a",
+    "\tShift 1\n",
+    "All Shifts",
+    "",
+]
+
+
+def _make_rows(n: int, seed: int) -> list[dict[str, str]]:
+    rnd = random.Random(seed)
+    rows = []
+    for i in range(n):
+        row = {c: "" for c in HISTORY_FIELDNAMES}
+        row.update(
+            save_id=f"s{i:04d}",
+            saved_at=f"2024-01-01T00:{rnd.randrange(60):02d}:00",
+            date_field=rnd.choice(_DATES),
+            shift=rnd.choice(_SHIFTS),
+            card_index=str(rnd.randrange(1, 4)),
+            detail_index=rnd.choice(["1", "2", " 3", "x", ""]),
+            action_index=rnd.choice(["1", "2", ""]),
+            issue=f"issue {i}",
+        )
+        rows.append(row)
+    return rows
+
+
+class TailCandidatesTest(unittest.TestCase):
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        root = Path(self._tmp.name)
+        self.service = LocalSyncDbService(root / "history.db", root / "sync")
+
+    def tearDown(self):
+        self._tmp.cleanup()
+
+    def test_tail_matches_python_view_order(self):
+        self.service.append_rows(_make_rows(300, seed=1))
+        full = _sort_rows_for_view(self.service.get_all_rows())
+        for lim in (1, 5, 40, 150, 299, 300, 1000):
+            with self.subTest(limit=lim):
+                tail = _sort_rows_for_view(
+                    self.service.get_tail_candidates(lim), limit=lim
+                )
+                self.assertEqual(tail, full[:lim])
+
+    def test_delta_matches_python_view_order(self):
+        self.service.append_rows(_make_rows(120, seed=2))
+        after = self.service.get_max_row_id()
+        new_rows = _make_rows(80, seed=3)
+        for r in new_rows:
+            r["save_id"] = "n" + r["save_id"]
+        self.service.append_rows(new_rows)
+
+        expected = _sort_rows_for_view(new_rows)
+        for lim in (1, 10, 80, 500):
+            with self.subTest(limit=lim):
+                tail = _sort_rows_for_view(
+                    self.service.get_tail_candidates(lim, after_row_id=after),
+                    limit=lim,
+                )
+                self.assertEqual(tail, expected[:lim])
+
+
+if __name__ == "__main__":
+    unittest.main()